@@ -1,78 +1,9 @@
 import streamlit as st
-import itertools
-import requests
-from functools import lru_cache
+from wow_tabuleiro import ler_tabuleiro, preencher_tabuleiro
+from palavras_wow import MODOS_PESQUISA, MODOS_LOCAIS, gerar_candidatos
+from cache_streamlit import AVISO_SEM_LEXICO, lexico, validador, palavras_validas, palavras_todos_tamanhos, solucoes_tabuleiro
 
 st.markdown("<h4 style='margin-bottom: 0.5em;'>🧩 Gerador de Palavras Válidas com Letras Repetidas (PT)</h4>", unsafe_allow_html=True)
-@lru_cache(maxsize=2048)
-def validar_datamuse(palavra):
-    """Valida palavra usando Datamuse API."""
-    url = "https://api.datamuse.com/words"
-    params = {"sp": palavra, "max": 1}
-    try:
-        resposta = requests.get(url, params=params, timeout=3)
-        if resposta.status_code == 200:
-            resultados = resposta.json()
-            return any(item["word"].lower() == palavra.lower() for item in resultados)
-    except Exception:
-        pass
-    return False
-
-@lru_cache(maxsize=2048)
-def validar_priberam(palavra):
-    """Valida palavra usando Priberam (dicionário de português) via scraping."""
-    url = f"https://dicionario.priberam.org/{palavra}"
-    try:
-        resposta = requests.get(url, timeout=3)
-        # Palavra válida se existe a secção de aceitação do Priberam
-        return "não foi encontrada" not in resposta.text.lower()
-    except Exception:
-        pass
-    return False
-
-@lru_cache(maxsize=2048)
-def validar_wiktionary(palavra):
-    """Valida palavra usando Wiktionary API."""
-    url = f"https://pt.wiktionary.org/w/api.php"
-    params = {
-        "action": "query",
-        "titles": palavra,
-        "format": "json"
-    }
-    try:
-        resposta = requests.get(url, params=params, timeout=3)
-        data = resposta.json()
-        pages = data.get("query", {}).get("pages", {})
-        return not "-1" in pages
-    except Exception:
-        pass
-    return False
-
-def validar_palavra(pt):
-    """Valida uma palavra em todas as fontes."""
-    return (
-        validar_datamuse(pt) or
-        validar_priberam(pt) or
-        validar_wiktionary(pt)
-    )
-
-def palavra_respeita_molde(palavra, molde):
-    """Verifica se a palavra cumpre o molde (letras nas posições corretas)"""
-    return all(m == "_" or m.lower() == p.lower() for m, p in zip(molde, palavra))
-
-def gerar_palavras_validas(letras, tamanho, molde=None):
-    """Gera permutações, filtra por molde e por palavras reais"""
-    letras = letras.lower()
-    todas = set(''.join(p) for p in itertools.permutations(letras, tamanho))
-    
-    # Filtra por molde se fornecido
-    if molde:
-        molde = molde.lower()
-        todas = [p for p in todas if palavra_respeita_molde(p, molde)]
-
-    # Valida palavras
-    palavras_validas = [p for p in todas if validar_palavra(p)]
-    return palavras_validas, todas
 
 # Interface Streamlit
 st.title("🧩 Gerador de Palavras Válidas com Letras Repetidas (PT)")
@@ -85,23 +16,86 @@ Exemplo: `rarroc`, `ação`, `amora`
 letras_input = st.text_input("Letras:", value="rarroc")
 
 if letras_input:
-    tamanho = st.number_input(
-        "Tamanho da palavra:", min_value=1, max_value=len(letras_input), step=1
-    )
-    molde = st.text_input(
-        "Molde da palavra (usa '_' para desconhecidos):", value="_"*tamanho
+    todos_tamanhos = st.checkbox("Todos os tamanhos (de 3 até ao número de letras)")
+    if not todos_tamanhos:
+        tamanho = st.number_input(
+            "Tamanho da palavra:", min_value=1, max_value=len(letras_input), step=1
+        )
+        molde = st.text_input(
+            "Molde da palavra (usa '_' para desconhecidos):", value="_"*tamanho
+        )
+
+    modo = st.radio(
+        "Modo de pesquisa:",
+        list(MODOS_PESQUISA),
+        index=0 if len(lexico()) else len(MODOS_PESQUISA) - 1,
     )
 
-    if len(molde) != tamanho:
+    if MODOS_PESQUISA[modo] in MODOS_LOCAIS and not len(lexico()):
+        # Os modos locais não têm palavras sem o léxico instalado
+        st.info(AVISO_SEM_LEXICO)
+    elif todos_tamanhos:
+        if st.button("🔍 Gerar Palavras"):
+            st.info("A procurar palavras de todos os tamanhos...")
+            grupos = {t: [] for t in range(3, len(letras_input) + 1)}
+            espacos = {t: st.empty() for t in grupos}
+            # Nos modos online as palavras chegam à medida que os pedidos respondem
+            for palavra in palavras_todos_tamanhos(letras_input, MODOS_PESQUISA[modo]):
+                grupo = grupos[len(palavra)]
+                grupo.append(palavra)
+                espacos[len(palavra)].markdown(f"**{len(palavra)} letras:** " + ", ".join(sorted(grupo)))
+            if not any(grupos.values()):
+                st.warning("Nenhuma palavra reconhecida com estas letras.")
+    elif len(molde) != tamanho:
         st.warning("O molde deve ter o mesmo número de letras indicado no tamanho.")
     elif st.button("🔍 Gerar Palavras"):
         st.info("A procurar palavras válidas em múltiplos dicionários...")
-        resultado, todas = gerar_palavras_validas(letras_input, tamanho, molde)
+        modo_pesquisa = MODOS_PESQUISA[modo]
+        if modo_pesquisa != "online":
+            resultado, todas = palavras_validas(letras_input, tamanho, molde, modo_pesquisa)
+        else:
+            # Mostra as palavras à medida que vão sendo confirmadas
+            todas = gerar_candidatos(letras_input, tamanho, molde)
+            resultado = []
+            parcial = st.empty()
+            for palavra in validador().validar_em_fluxo(todas):
+                resultado.append(palavra)
+                parcial.markdown(", ".join(sorted(resultado)))
+            parcial.empty()
         
         if resultado:
             st.success(f"Encontradas {len(resultado)} palavra(s) reconhecidas:")
             st.markdown(", ".join(sorted(resultado)))
+        elif modo_pesquisa in MODOS_LOCAIS:
+            st.warning("Nenhuma palavra encontrada no léxico local.")
+        elif modo_pesquisa == "padrao":
+            st.warning("Nenhuma palavra da Datamuse encaixa no molde com estas letras.")
         else:
             st.warning("Nenhuma palavra reconhecida nos dicionários. Eis as possíveis combinações:")
             st.markdown(", ".join(sorted(todas)))
-            st.info("Talvez alguma combinação seja válida mas não está listada nos dicionários online.")
\ No newline at end of file
+            st.info("Talvez alguma combinação seja válida mas não está listada nos dicionários online.")
+
+with st.expander("🗺️ Resolver tabuleiro completo"):
+    st.markdown("""
+    Desenha o tabuleiro com uma linha por fila: `_` para casas por preencher,
+    letras nas casas já conhecidas e espaços onde não há casa.
+    Os cruzamentos são deduzidos das casas partilhadas.
+    """)
+    tabuleiro_input = st.text_area("Tabuleiro:", value="_____\n_   _\n_   _", height=150)
+    if st.button("🧩 Resolver tabuleiro"):
+        espacos = ler_tabuleiro(tabuleiro_input)
+        if not letras_input or not espacos:
+            st.warning("Indica as letras e um tabuleiro com pelo menos um espaço de 2 ou mais casas.")
+        elif not len(lexico()):
+            st.info(AVISO_SEM_LEXICO)
+        else:
+            solucoes = solucoes_tabuleiro(letras_input, tabuleiro_input, max_solucoes=2)
+            if not solucoes:
+                st.warning("Nenhuma forma de preencher o tabuleiro com as palavras do léxico local.")
+            else:
+                if len(solucoes) > 1:
+                    st.info("O tabuleiro tem mais do que uma solução; eis uma delas.")
+                st.code(preencher_tabuleiro(tabuleiro_input, espacos, solucoes[0]))
+                for espaco, palavra in zip(espacos, solucoes[0]):
+                    direcao = "horizontal" if espaco.direcao == "H" else "vertical"
+                    st.markdown(f"- ({espaco.linha + 1},{espaco.coluna + 1}) {direcao}: **{palavra}**")
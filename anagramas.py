@@ -0,0 +1,242 @@
+import os
+import zlib
+from collections import Counter, defaultdict
+from functools import lru_cache
+from lexico import CAMINHO_LEXICO, carregar_lexico, dobrar
+
+_MAGIA_INDICE = b"PTANAG\x00\x02"
+
+
+def _arranjos(letras, minimo, maximo):
+    contagem = Counter(letras)
+    distintas = sorted(contagem)
+    restantes = [contagem[letra] for letra in distintas]
+    atual = []
+
+    def recuar():
+        if len(atual) >= minimo:
+            yield "".join(atual)
+        if len(atual) == maximo:
+            return
+        for i, letra in enumerate(distintas):
+            if restantes[i]:
+                restantes[i] -= 1
+                atual.append(letra)
+                yield from recuar()
+                atual.pop()
+                restantes[i] += 1
+
+    if 0 <= minimo <= maximo <= len(letras):
+        yield from recuar()
+
+
+def permutacoes_distintas(letras, tamanho):
+    """
+    Gera cada arranjo distinto de `tamanho` letras tiradas de `letras`,
+    exatamente uma vez e de forma preguiçosa.
+
+    As letras repetidas são tratadas como multiconjunto (contagem por letra),
+    por isso nunca se constroem permutações duplicadas.
+    """
+    return _arranjos(letras, tamanho, tamanho)
+
+
+def permutacoes_todos_tamanhos(letras, minimo=3):
+    """
+    Gera os arranjos distintos de todos os tamanhos entre `minimo` e
+    len(letras) numa só travessia: cada prefixo é construído uma vez e
+    serve todos os tamanhos que o prolongam.
+    """
+    return _arranjos(letras, minimo, len(letras))
+
+
+def procurar_no_lexico(letras, tamanho, lexico, molde=None):
+    """
+    Gera as palavras do `lexico` com `tamanho` letras que se formam com `letras`
+    e respeitam o `molde` ('_' nas posições desconhecidas).
+
+    Percorre o multiconjunto de letras e a trie do léxico em simultâneo: as
+    posições conhecidas do molde ficam reservadas à partida e cada ramo é
+    abandonado assim que o prefixo deixa de existir no léxico. A pesquisa é
+    feita sem acentos e cada chave encontrada devolve as suas formas acentuadas.
+    """
+    letras = dobrar(letras)
+    molde = dobrar(molde) if molde else None
+    contagem = Counter(letras)
+    fixas = [None] * tamanho
+    if molde:
+        for i, m in enumerate(molde[:tamanho]):
+            if m != "_":
+                fixas[i] = m
+                contagem[m] -= 1
+                if contagem[m] < 0:
+                    return
+    if tamanho > len(letras):
+        return
+
+    distintas = sorted(letra for letra in contagem if contagem[letra] > 0)
+    restantes = [contagem[letra] for letra in distintas]
+    atual = []
+
+    def recuar(no, posicao):
+        if posicao == tamanho:
+            if lexico.terminal(no):
+                yield from lexico.formas_no(no, "".join(atual))
+            return
+        fixa = fixas[posicao]
+        if fixa is not None:
+            filho = lexico.filho(no, fixa)
+            if filho >= 0:
+                atual.append(fixa)
+                yield from recuar(filho, posicao + 1)
+                atual.pop()
+            return
+        for i, letra in enumerate(distintas):
+            if restantes[i]:
+                filho = lexico.filho(no, letra)
+                if filho < 0:
+                    continue
+                restantes[i] -= 1
+                atual.append(letra)
+                yield from recuar(filho, posicao + 1)
+                atual.pop()
+                restantes[i] += 1
+
+    yield from recuar(0, 0)
+
+
+def procurar_todos_tamanhos(letras, lexico, minimo=3):
+    """
+    Gera as palavras do `lexico` com pelo menos `minimo` letras que se formam
+    com `letras`, percorrendo a trie uma só vez para todos os tamanhos.
+    """
+    contagem = Counter(dobrar(letras))
+    distintas = sorted(contagem)
+    restantes = [contagem[letra] for letra in distintas]
+    atual = []
+
+    def recuar(no):
+        if len(atual) >= minimo and lexico.terminal(no):
+            yield from lexico.formas_no(no, "".join(atual))
+        for i, letra in enumerate(distintas):
+            if restantes[i]:
+                filho = lexico.filho(no, letra)
+                if filho < 0:
+                    continue
+                restantes[i] -= 1
+                atual.append(letra)
+                yield from recuar(filho)
+                atual.pop()
+                restantes[i] += 1
+
+    yield from recuar(0)
+
+
+def formavel(palavra, letras):
+    """Indica se `palavra` se escreve só com as letras disponíveis (com repetições, sem acentos)."""
+    return not (Counter(dobrar(palavra)) - Counter(dobrar(letras)))
+
+
+def assinatura(palavra):
+    """Letras da palavra, sem acentos, por ordem alfabética (igual para todos os anagramas)."""
+    return "".join(sorted(dobrar(palavra)))
+
+
+class IndiceAnagramas:
+    """
+    Índice de assinatura (letras ordenadas) para as palavras do léxico.
+
+    Responde a "que palavras se formam com estas letras" percorrendo os
+    sub-multiconjuntos das letras, sem gerar permutações: no máximo 2^n
+    consultas, e muito menos quando há letras repetidas.
+    """
+
+    __slots__ = ("_palavras",)
+
+    def __init__(self, palavras_por_assinatura):
+        self._palavras = palavras_por_assinatura
+
+    @classmethod
+    def de_palavras(cls, palavras):
+        """Constrói o índice a partir de um iterável de palavras."""
+        indice = defaultdict(list)
+        for palavra in palavras:
+            indice[assinatura(palavra)].append(palavra)
+        return cls(dict(indice))
+
+    def guardar(self, caminho):
+        """Grava o índice num ficheiro binário comprimido."""
+        linhas = "\n".join(
+            " ".join([chave, *palavras]) for chave, palavras in sorted(self._palavras.items())
+        )
+        temporario = caminho + ".tmp"
+        with open(temporario, "wb") as f:
+            f.write(_MAGIA_INDICE)
+            f.write(zlib.compress(linhas.encode("utf-8"), 9))
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def abrir(cls, caminho):
+        """Lê um índice gravado com `guardar`."""
+        with open(caminho, "rb") as f:
+            dados = f.read()
+        if not dados.startswith(_MAGIA_INDICE):
+            raise ValueError(f"Ficheiro de índice de anagramas inválido: {caminho}")
+        try:
+            texto = zlib.decompress(dados[len(_MAGIA_INDICE):]).decode("utf-8")
+        except zlib.error as erro:
+            raise ValueError(f"Ficheiro de índice de anagramas corrompido: {caminho}") from erro
+        indice = {}
+        for linha in texto.splitlines():
+            chave, *palavras = linha.split(" ")
+            indice[chave] = palavras
+        return cls(indice)
+
+    def __len__(self):
+        return len(self._palavras)
+
+    def anagramas(self, letras):
+        """Palavras que usam exatamente todas as `letras`."""
+        return list(self._palavras.get(assinatura(letras), ()))
+
+    def subanagramas(self, letras, minimo=1, maximo=None):
+        """Gera as palavras com `minimo` a `maximo` letras que se formam com `letras`."""
+        contagem = Counter(dobrar(letras))
+        distintas = sorted(contagem)
+        maximo = len(letras) if maximo is None else maximo
+
+        def recuar(i, prefixo):
+            if i == len(distintas):
+                if minimo <= len(prefixo):
+                    yield from self._palavras.get(prefixo, ())
+                return
+            letra = distintas[i]
+            for vezes in range(min(contagem[letra], maximo - len(prefixo)) + 1):
+                yield from recuar(i + 1, prefixo + letra * vezes)
+
+        yield from recuar(0, "")
+
+
+@lru_cache(maxsize=None)
+def carregar_indice_anagramas(caminho=CAMINHO_LEXICO):
+    """
+    Carrega o índice de anagramas do léxico em `caminho`, construindo-o e
+    gravando-o (`<caminho>.anagramas`) na primeira utilização.
+    """
+    ficheiro = caminho + ".anagramas"
+    if os.path.exists(ficheiro) and (
+        not os.path.exists(caminho) or os.path.getmtime(ficheiro) >= os.path.getmtime(caminho)
+    ):
+        try:
+            return IndiceAnagramas.abrir(ficheiro)
+        except ValueError:
+            # Formato antigo ou ficheiro corrompido: volta a ser gerado a partir do léxico
+            pass
+    lexico = carregar_lexico(caminho)
+    indice = IndiceAnagramas.de_palavras(lexico.palavras())
+    if len(lexico):
+        try:
+            indice.guardar(ficheiro)
+        except OSError:
+            pass
+    return indice
@@ -0,0 +1,87 @@
+"""
+Compara a extração de sinónimos do dicio.com.br: a análise da página
+inteira (como era feita) com a leitura parcial e a análise só do bloco
+dos sinónimos.
+
+As páginas vêm de benchmarks/fixtures/dicio e são servidas pelo servidor
+local (stub_fornecedores.py), para medir também quanto da resposta chega
+a ser lido.
+
+Uso: python benchmarks/dicio_extracao.py [repeticoes]
+"""
+import os
+import sys
+import time
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_fornecedores import ServidorStub  # noqa: E402
+
+stub = ServidorStub().iniciar()
+os.environ.update(stub.variaveis())
+os.environ["PASSATEMPOS_CACHE"] = os.path.join(tempfile.mkdtemp(), "cache.sqlite3")
+PAGINAS = sorted(stub.paginas_dicio)
+
+from bs4 import BeautifulSoup  # noqa: E402
+from fornecedores import DICIO  # noqa: E402
+from consultas import _BLOCO_SINONIMOS_DICIO, consultar_dicio, extrair_sinonimos_dicio  # noqa: E402
+
+
+def extrair_pagina_inteira(html):
+    """Extração original: árvore completa da página com html.parser."""
+    bloco = BeautifulSoup(html, "html.parser").find("p", class_="adicional sinonimos")
+    if not bloco:
+        return []
+    partes = bloco.get_text(strip=True).split(":")
+    return [s.strip() for s in partes[1].split(",")] if len(partes) > 1 else []
+
+
+def antes(palavra):
+    resultado = DICIO.obter(f"{palavra}/")
+    return extrair_pagina_inteira(resultado.texto), len(resultado.texto)
+
+
+def depois(palavra):
+    resultado = DICIO.obter(f"{palavra}/", ate=_BLOCO_SINONIMOS_DICIO)
+    bloco = _BLOCO_SINONIMOS_DICIO.search(resultado.texto)
+    return extrair_sinonimos_dicio(bloco.group() if bloco else resultado.texto), len(resultado.texto)
+
+
+def medir(funcao, palavra, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        sinonimos, lidos = funcao(palavra)
+    return (time.perf_counter() - inicio) / repeticoes * 1000, sinonimos, lidos
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"{'página':<12}{'antes (ms)':>12}{'depois (ms)':>13}{'lido antes':>12}{'lido depois':>13}  sinónimos")
+    total_antes = total_depois = 0.0
+    for palavra in PAGINAS:
+        t_antes, sin_antes, lidos_antes = medir(antes, palavra, repeticoes)
+        t_depois, sin_depois, lidos_depois = medir(depois, palavra, repeticoes)
+        assert sin_antes == sin_depois, (palavra, sin_antes, sin_depois)
+        total_antes += t_antes
+        total_depois += t_depois
+        print(
+            f"{palavra:<12}{t_antes:>12.2f}{t_depois:>13.2f}{lidos_antes:>12}{lidos_depois:>13}"
+            f"  {len(sin_depois)}"
+        )
+    print(f"{'total':<12}{total_antes:>12.2f}{total_depois:>13.2f}  ({total_antes / total_depois:.1f}x)")
+
+    # Com a lista de sinónimos em cache a página nem chega a ser pedida
+    palavra = PAGINAS[0]
+    consultar_dicio(palavra)
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        consultar_dicio(palavra)
+    print(f"consultar_dicio em cache: {(time.perf_counter() - inicio) / repeticoes * 1000:.3f} ms")
+    stub.parar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Bateria de latência das consultas online contra o servidor local
+(stub_fornecedores.py): geração de palavras do WOW, sinónimos e pesquisa
+de pistas das Cruzadas, com fornecedores rápidos, lentos, com erros e com
+limite de pedidos.
+
+Para cada cenário mostra o débito (operações por segundo), os percentis
+p50/p95/p99 da latência de cada operação, os pedidos que chegaram a cada
+fornecedor e as consultas poupadas por juntar pedidos iguais em curso.
+
+As entradas de cada cenário repetem-se em rondas até haver pelo menos
+`amostras` medições (100 por omissão), para que p95 e p99 não sejam só o
+máximo; cada ronda começa com a cache vazia e sem pedidos em curso.
+
+Uso: python benchmarks/fornecedores_latencia.py [filtro de cenários] [amostras]
+"""
+import os
+import sys
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_fornecedores import ServidorStub, percentil  # noqa: E402
+
+stub = ServidorStub().iniciar()
+os.environ.update(stub.variaveis())
+# Sem léxico nem tesauro locais: todas as consultas vão aos fornecedores
+pasta = tempfile.mkdtemp()
+os.environ["PASSATEMPOS_CACHE"] = os.path.join(pasta, "cache.sqlite3")
+os.environ["PASSATEMPOS_LEXICO"] = os.path.join(pasta, "sem_lexico.txt")
+os.environ["PASSATEMPOS_TESAURO"] = os.path.join(pasta, "sem_tesauro.dat")
+
+import fornecedores  # noqa: E402
+from cache import obter_cache, pedidos_partilhados  # noqa: E402
+from consultas import obter_sinonimos_combinados, pesquisar_pista  # noqa: E402
+from palavras_wow import gerar_palavras_validas  # noqa: E402
+
+AMOSTRAS = 100
+
+LETRAS_WOW = [("rarroc", 4), ("amora", 5), ("casal", 4), ("lascas", 5), ("rocas", 4), ("almas", 4)]
+PALAVRAS = ["casa", "feliz", "rapido", "carro", "lento", "mar", "xilografo", "sol"]
+
+
+def wow(modo):
+    return lambda entrada: gerar_palavras_validas(entrada[0], entrada[1], modo=modo)
+
+
+def cruzadas(palavra):
+    return list(pesquisar_pista(palavra))
+
+
+# (nome, comportamento dos fornecedores, operação, entradas, clientes em simultâneo)
+CENARIOS = [
+    ("wow online", {}, wow("online"), LETRAS_WOW, 4),
+    ("wow padrão", {}, wow("padrao"), LETRAS_WOW, 4),
+    ("sinónimos", {}, obter_sinonimos_combinados, PALAVRAS, 4),
+    ("cruzadas", {}, cruzadas, PALAVRAS, 4),
+    ("wow online lento", {"latencia": 0.1}, wow("online"), LETRAS_WOW, 4),
+    ("sinónimos lento", {"latencia": 0.2}, obter_sinonimos_combinados, PALAVRAS, 4),
+    ("cruzadas lento", {"latencia": 0.2}, cruzadas, PALAVRAS, 4),
+    ("cruzadas erros 10%", {"latencia": 0.05, "erros": 0.1}, cruzadas, PALAVRAS, 4),
+    ("wow online limite 50/s", {"latencia": 0.02, "limite": 50}, wow("online"), LETRAS_WOW, 4),
+    ("cruzadas rajada", {"latencia": 0.2}, cruzadas, ["casa"] * 16, 16),
+]
+
+
+def esvaziar():
+    """Cache vazia, disjuntores fechados e nenhum pedido da ronda anterior em curso."""
+    stub.esperar_inativo()
+    obter_cache().limpar()
+    for fornecedor in (fornecedores.DATAMUSE, fornecedores.DICIONARIO, fornecedores.DICIO,
+                       fornecedores.PRIBERAM, fornecedores.WIKTIONARY):
+        fornecedor.disjuntor.sucesso()
+
+
+def correr(nome, comportamento, operacao, entradas, clientes, amostras=AMOSTRAS):
+    stub.configurar(**comportamento)
+    esvaziar()
+    stub.repor_contagens()
+    partilhados_antes = pedidos_partilhados()
+
+    def medir(entrada):
+        inicio = time.perf_counter()
+        operacao(entrada)
+        return time.perf_counter() - inicio
+
+    tempos = []
+    duracao = 0.0
+    while len(tempos) < amostras:
+        if tempos:
+            esvaziar()
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clientes) as executor:
+            tempos.extend(t * 1000 for t in executor.map(medir, entradas))
+        duracao += time.perf_counter() - inicio
+
+    pedidos = stub.repor_contagens()
+    partilhados = {
+        f: n - partilhados_antes.get(f, 0) for f, n in pedidos_partilhados().items()
+        if n > partilhados_antes.get(f, 0)
+    }
+    print(
+        f"{nome:<24}{len(tempos):>5}{len(tempos) / duracao:>8.1f}"
+        f"{percentil(tempos, 50):>8.0f}{percentil(tempos, 95):>8.0f}{percentil(tempos, 99):>8.0f}"
+        f"{max(tempos):>8.0f}{sum(pedidos.values()):>9}{sum(partilhados.values()):>7}  "
+        + ", ".join(f"{f}={n}" for f, n in sorted(pedidos.items()))
+    )
+
+
+def main():
+    filtro = sys.argv[1] if len(sys.argv) > 1 else ""
+    amostras = int(sys.argv[2]) if len(sys.argv) > 2 else AMOSTRAS
+    print(
+        f"{'cenário':<24}{'ops':>5}{'ops/s':>8}{'p50':>8}{'p95':>8}{'p99':>8}{'máx':>8}"
+        f"{'pedidos':>9}{'junt.':>7}  por fornecedor"
+    )
+    for cenario in CENARIOS:
+        if filtro in cenario[0]:
+            correr(*cenario, amostras=amostras)
+    stub.parar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Latência do separador Sinonimos: a sequência antiga (Datamuse e, só
+depois, o dicio) contra `obter_sinonimos_combinados`, que lança o dicio
+antecipadamente e corta no orçamento de tempo.
+
+O servidor local (stub_fornecedores.py) faz de Datamuse e de dicio com
+respostas sintéticas e latências sorteadas (fixas por palavra, iguais
+para as duas versões): a maioria rápidas, algumas lentas e uma cauda
+muito lenta. Cada palavra é pedida uma só vez por versão, para nunca
+acertar na cache.
+
+Uso: python benchmarks/sinonimos_latencia.py [palavras]
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, unquote
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_fornecedores import ServidorStub, percentil  # noqa: E402
+
+
+def perfil(palavra):
+    """(latência Datamuse, n.º de sinónimos Datamuse, latência dicio) da palavra."""
+    sorteio = random.Random(palavra.split("-", 1)[-1])
+    latencia = sorteio.choices((0.08, 0.4, 1.5), weights=(75, 20, 5))[0]
+    return latencia * sorteio.uniform(0.8, 1.2), sorteio.randint(0, 8), sorteio.uniform(0.15, 0.3)
+
+
+def _palavra_dicio(url):
+    return unquote(url.path[len("/dicio/"):]).strip("/")
+
+
+class StubSinonimos(ServidorStub):
+    """Datamuse e dicio com sinónimos sintéticos para qualquer palavra."""
+
+    def _datamuse(self, url, params):
+        _, quantos, _ = perfil(params["rel_syn"][0])
+        return 200, "application/json", json.dumps([{"word": f"datamuse{i}"} for i in range(quantos)])
+
+    def _dicio(self, url, params):
+        ligacoes = ", ".join(f'<a href="/dicio{i}/">dicio{i}</a>' for i in range(6))
+        return 200, "text/html; charset=utf-8", (
+            f'<html><body><p class="adicional sinonimos"><span>Sinônimos</span>: {ligacoes}</p></body></html>'
+        )
+
+
+stub = StubSinonimos().iniciar()
+stub.configurar(["datamuse"], atraso=lambda url: perfil(parse_qs(url.query)["rel_syn"][0])[0])
+stub.configurar(["dicio"], atraso=lambda url: perfil(_palavra_dicio(url))[2])
+os.environ.update(stub.variaveis())
+os.environ["PASSATEMPOS_CACHE"] = os.path.join(tempfile.mkdtemp(), "cache.sqlite3")
+os.environ["PASSATEMPOS_TESAURO"] = os.path.join(tempfile.mkdtemp(), "sem_tesauro.dat")
+
+from consultas import (  # noqa: E402
+    MINIMO_SINONIMOS, obter_sinonimos_tesauro, obter_sinonimos_datamuse,
+    obter_sinonimos_dicio, obter_sinonimos_combinados,
+)
+
+
+def sequencial(palavra):
+    """Cadeia anterior: cada fonte só começa quando a anterior acabou."""
+    resultados = set(obter_sinonimos_tesauro(palavra))
+    if len(resultados) < MINIMO_SINONIMOS:
+        resultados.update(obter_sinonimos_datamuse(palavra))
+    if len(resultados) < MINIMO_SINONIMOS:
+        resultados.update(obter_sinonimos_dicio(palavra))
+    return resultados
+
+
+def correr(nome, funcao, palavras):
+    def medir(palavra):
+        inicio = time.perf_counter()
+        resultados = funcao(palavra)
+        return time.perf_counter() - inicio, len(resultados)
+
+    # Alguns utilizadores em simultâneo, como num servidor Streamlit
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        medidas = list(executor.map(medir, [f"{nome}-{p}" for p in palavras]))
+    tempos = [t * 1000 for t, _ in medidas]
+    media_sinonimos = sum(n for _, n in medidas) / len(medidas)
+    print(
+        f"{nome:<12}{percentil(tempos, 50):>9.0f}{percentil(tempos, 95):>9.0f}"
+        f"{percentil(tempos, 99):>9.0f}{max(tempos):>9.0f}{media_sinonimos:>12.1f}"
+    )
+
+
+def main():
+    quantas = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    palavras = [f"palavra{i}" for i in range(quantas)]
+    print(f"{'versão':<12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'máx ms':>9}{'sinónimos':>12}")
+    correr("sequencial", sequencial, palavras)
+    correr("combinada", obter_sinonimos_combinados, palavras)
+    stub.parar()
+
+
+if __name__ == "__main__":
+    main()
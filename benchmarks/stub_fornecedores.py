@@ -0,0 +1,267 @@
+"""
+Servidor local que faz de Datamuse, dictionaryapi.dev, dicio, Priberam e
+Wiktionary, com respostas gravadas (benchmarks/fixtures) e latência, erros
+e limite de pedidos configuráveis por fornecedor.
+
+As respostas seguem o formato de cada serviço:
+- o vocabulário gravado decide as validações (Datamuse `sp`, Priberam e
+  Wiktionary, incluindo consultas de vários títulos) e os padrões `c??r?`;
+- as relações `rel_syn`/`ml` da Datamuse e as definições vêm das gravações;
+- as páginas do dicio são as de benchmarks/fixtures/dicio.
+
+Para respostas sintéticas (ex.: qualquer palavra), uma bateria pode
+criar uma subclasse de `ServidorStub` e redefinir `_datamuse`, `_dicio`,
+etc.; `Comportamento(atraso=...)` dá uma latência própria a cada pedido.
+
+Uso isolado:
+    python benchmarks/stub_fornecedores.py [porta] [--latencia 0.1] [--erros 0.05] [--limite 20]
+e depois exportar as variáveis PASSATEMPOS_URL_* que ele mostra.
+"""
+import os
+import re
+import json
+import math
+import time
+import random
+import argparse
+import threading
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, unquote
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# As respostas são enviadas aos poucos, como uma página servida pela rede
+BLOCO_ENVIO = 4096
+
+# Caminho de cada fornecedor no servidor e variável de ambiente que o aponta
+FORNECEDORES = {
+    "datamuse": ("/datamuse/words", "PASSATEMPOS_URL_DATAMUSE"),
+    "dictionaryapi": ("/dictionaryapi/", "PASSATEMPOS_URL_DICIONARIO"),
+    "dicio": ("/dicio/", "PASSATEMPOS_URL_DICIO"),
+    "priberam": ("/priberam/", "PASSATEMPOS_URL_PRIBERAM"),
+    "wiktionary": ("/wiktionary/w/api.php", "PASSATEMPOS_URL_WIKTIONARY"),
+}
+
+
+def percentil(valores, p):
+    """Percentil `p` (0-100) pelo método do posto mais próximo."""
+    ordenados = sorted(valores)
+    posto = max(1, math.ceil(p / 100 * len(ordenados)))
+    return ordenados[posto - 1]
+
+
+class Comportamento:
+    """
+    Latência (segundos, com variação relativa), taxa de erros 5xx e limite
+    de pedidos por segundo. `atraso`, se indicado, é uma função do URL do
+    pedido que devolve a latência em vez de `latencia`.
+    """
+
+    def __init__(self, latencia=0.0, variacao=0.2, erros=0.0, limite=None, atraso=None):
+        self.latencia = latencia
+        self.variacao = variacao
+        self.erros = erros
+        self.limite = limite
+        self.atraso = atraso
+        self._janela = (0, 0)
+        self._trinco = threading.Lock()
+
+    def espera(self, url):
+        if self.atraso is not None:
+            return self.atraso(url)
+        return max(0.0, self.latencia * random.uniform(1 - self.variacao, 1 + self.variacao))
+
+    def excede_limite(self):
+        # Janela fixa de um segundo, como a maioria dos limites das APIs públicas
+        if self.limite is None:
+            return False
+        with self._trinco:
+            segundo, pedidos = self._janela
+            agora = int(time.monotonic())
+            if agora != segundo:
+                segundo, pedidos = agora, 0
+            self._janela = (segundo, pedidos + 1)
+            return pedidos + 1 > self.limite
+
+
+class ServidorStub:
+    """Servidor HTTP em segundo plano; conta os pedidos recebidos por fornecedor."""
+
+    def __init__(self, gravacoes=None, porta=0):
+        if gravacoes is None:
+            with open(os.path.join(FIXTURES, "gravacoes.json"), encoding="utf-8") as f:
+                gravacoes = json.load(f)
+        self.vocabulario = set(gravacoes["vocabulario"])
+        self.relacoes = gravacoes["datamuse"]
+        self.definicoes = gravacoes["definicoes"]
+        pasta_dicio = os.path.join(FIXTURES, "dicio")
+        self.paginas_dicio = {
+            nome[:-len(".html")]: open(os.path.join(pasta_dicio, nome), "rb").read()
+            for nome in os.listdir(pasta_dicio)
+            if nome.endswith(".html")
+        }
+        self.comportamentos = {nome: Comportamento() for nome in FORNECEDORES}
+        self.pedidos = Counter()
+        self.em_curso = 0
+        self._trinco = threading.Lock()
+        self._servidor = ThreadingHTTPServer(("127.0.0.1", porta), self._manipulador())
+        self._servidor.daemon_threads = True
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._servidor.server_port}"
+
+    def variaveis(self):
+        """Variáveis de ambiente que apontam os fornecedores para este servidor."""
+        return {variavel: self.url + caminho for caminho, variavel in FORNECEDORES.values()}
+
+    def iniciar(self):
+        threading.Thread(target=self._servidor.serve_forever, daemon=True).start()
+        return self
+
+    def parar(self):
+        self._servidor.shutdown()
+        self._servidor.server_close()
+
+    def configurar(self, fornecedores=None, **opcoes):
+        """Muda o comportamento dos fornecedores indicados (todos, por omissão)."""
+        for nome in fornecedores or FORNECEDORES:
+            self.comportamentos[nome] = Comportamento(**opcoes)
+
+    def esperar_inativo(self, maximo=10.0):
+        """Espera que não haja pedidos a ser servidos (ex.: consultas em segundo plano)."""
+        limite = time.monotonic() + maximo
+        while self.em_curso and time.monotonic() < limite:
+            time.sleep(0.01)
+
+    def repor_contagens(self):
+        with self._trinco:
+            contagens = dict(self.pedidos)
+            self.pedidos.clear()
+        return contagens
+
+    # Respostas ----------------------------------------------------------------
+
+    def _datamuse(self, url, params):
+        if "sp" in params:
+            padrao = params["sp"][0].lower()
+            maximo = int(params.get("max", ["100"])[0])
+            if "?" in padrao or "*" in padrao:
+                expressao = re.compile(re.escape(padrao).replace(r"\?", ".").replace(r"\*", ".*") + "$")
+                palavras = sorted(p for p in self.vocabulario if expressao.match(p))
+            else:
+                palavras = [padrao] if padrao in self.vocabulario else []
+            return 200, "application/json", json.dumps([{"word": p} for p in palavras[:maximo]])
+        for relacao in ("rel_syn", "ml"):
+            if relacao in params:
+                palavras = self.relacoes[relacao].get(params[relacao][0].lower(), [])
+                maximo = int(params.get("max", ["100"])[0])
+                return 200, "application/json", json.dumps([{"word": p} for p in palavras[:maximo]])
+        return 200, "application/json", "[]"
+
+    def _dictionaryapi(self, url, params):
+        palavra = unquote(url.path[len("/dictionaryapi/"):]).lower()
+        definicoes = self.definicoes.get(palavra)
+        if not definicoes:
+            return 404, "application/json", json.dumps({"title": "No Definitions Found"})
+        sentidos = [{"definitions": [{"definition": d} for d in definicoes]}]
+        return 200, "application/json", json.dumps([{"word": palavra, "meanings": sentidos}])
+
+    def _dicio(self, url, params):
+        pagina = self.paginas_dicio.get(unquote(url.path[len("/dicio/"):]).strip("/").lower())
+        if pagina is None:
+            return 404, "text/html; charset=utf-8", "<html><body>Página não encontrada</body></html>"
+        return 200, "text/html; charset=utf-8", pagina
+
+    def _priberam(self, url, params):
+        palavra = unquote(url.path[len("/priberam/"):]).lower()
+        if palavra in self.vocabulario:
+            return 200, "text/html; charset=utf-8", f"<html><body><div class='pb-def'>{palavra}</div></body></html>"
+        return 200, "text/html; charset=utf-8", "<html><body>A palavra não foi encontrada.</body></html>"
+
+    def _wiktionary(self, url, params):
+        titulos = params.get("titles", [""])[0].split("|")
+        paginas = {}
+        for i, titulo in enumerate(titulos):
+            if titulo in self.vocabulario:
+                paginas[str(1000 + i)] = {"pageid": 1000 + i, "ns": 0, "title": titulo}
+            else:
+                paginas[str(-1 - i)] = {"ns": 0, "title": titulo, "missing": ""}
+        return 200, "application/json", json.dumps({"batchcomplete": "", "query": {"pages": paginas}})
+
+    def _manipulador(self):
+        stub = self
+
+        class Manipulador(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                nome = next((n for n, (c, _) in FORNECEDORES.items() if url.path.startswith(c)), None)
+                if nome is None:
+                    self._responder(404, "text/plain", "fornecedor desconhecido")
+                    return
+                with stub._trinco:
+                    stub.pedidos[nome] += 1
+                    stub.em_curso += 1
+                try:
+                    self._servir(nome, url)
+                finally:
+                    with stub._trinco:
+                        stub.em_curso -= 1
+
+            def _servir(self, nome, url):
+                comportamento = stub.comportamentos[nome]
+                if comportamento.excede_limite():
+                    self._responder(429, "text/plain", "Too Many Requests", {"Retry-After": "1"})
+                    return
+                time.sleep(comportamento.espera(url))
+                if random.random() < comportamento.erros:
+                    self._responder(503, "text/plain", "Service Unavailable")
+                    return
+                estado, tipo, corpo = getattr(stub, "_" + nome)(url, parse_qs(url.query))
+                self._responder(estado, tipo, corpo)
+
+            def _responder(self, estado, tipo, corpo, cabecalhos=None):
+                dados = corpo if isinstance(corpo, bytes) else corpo.encode("utf-8")
+                try:
+                    self.send_response(estado)
+                    self.send_header("Content-Type", tipo)
+                    self.send_header("Content-Length", str(len(dados)))
+                    for nome, valor in (cabecalhos or {}).items():
+                        self.send_header(nome, valor)
+                    self.end_headers()
+                    for i in range(0, len(dados), BLOCO_ENVIO):
+                        self.wfile.write(dados[i:i + BLOCO_ENVIO])
+                except (BrokenPipeError, ConnectionResetError):
+                    # O cliente pode fechar a meio (ex.: leitura parcial do dicio)
+                    pass
+
+        return Manipulador
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    argumentos.add_argument("porta", type=int, nargs="?", default=8765)
+    argumentos.add_argument("--latencia", type=float, default=0.0, help="segundos por pedido")
+    argumentos.add_argument("--erros", type=float, default=0.0, help="fração de respostas 503")
+    argumentos.add_argument("--limite", type=int, default=None, help="pedidos por segundo antes de 429")
+    opcoes = argumentos.parse_args()
+
+    stub = ServidorStub(porta=opcoes.porta)
+    stub.configurar(latencia=opcoes.latencia, erros=opcoes.erros, limite=opcoes.limite)
+    stub.iniciar()
+    for variavel, url in stub.variaveis().items():
+        print(f"export {variavel}={url}")
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        print("Pedidos recebidos:", dict(stub.pedidos))
+        stub.parar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+import os
+import json
+import atexit
+import time
+import sqlite3
+import threading
+from collections import Counter
+from functools import wraps
+
+# Base de dados partilhada por todos os processos (ex.: trabalhadores do Streamlit)
+CAMINHO_CACHE = os.environ.get(
+    "PASSATEMPOS_CACHE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados", "cache.sqlite3"),
+)
+
+TTL_POSITIVO = 7 * 24 * 3600
+TTL_NEGATIVO = 24 * 3600
+MAX_ENTRADAS = 100_000
+
+# Só se atualiza o instante de acesso de uma entrada se for mais antigo do que isto
+_RESOLUCAO_ACESSO = 60
+
+# Os contadores e os acessos ficam em memória e são escritos no máximo com este
+# intervalo (segundos), para que uma leitura da cache não precise de escrever
+_INTERVALO_DESCARGA = 30
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS entradas (
+    fornecedor TEXT NOT NULL,
+    consulta TEXT NOT NULL,
+    valor TEXT NOT NULL,
+    expira REAL NOT NULL,
+    acesso REAL NOT NULL,
+    PRIMARY KEY (fornecedor, consulta)
+);
+CREATE INDEX IF NOT EXISTS entradas_acesso ON entradas (acesso);
+CREATE TABLE IF NOT EXISTS contadores (
+    fornecedor TEXT PRIMARY KEY,
+    acertos INTEGER NOT NULL DEFAULT 0,
+    falhas INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_SEM_VALOR = object()
+
+
+class CacheDisco:
+    """
+    Cache persistente em SQLite para as respostas dos fornecedores online.
+
+    As entradas são indexadas por (fornecedor, consulta) e guardadas em JSON.
+    Respostas positivas e negativas (valor vazio/falso) têm prazos distintos;
+    acima de `max_entradas` removem-se as menos usadas recentemente. O modo
+    WAL permite leituras e escritas concorrentes de vários processos.
+
+    Uma consulta é só um SELECT: os acertos/falhas e os instantes de acesso
+    acumulam-se em memória e são gravados de uma vez por `descarregar`
+    (ao podar, ao pedir estatísticas e no máximo a cada
+    `_INTERVALO_DESCARGA` segundos).
+    """
+
+    def __init__(self, caminho=CAMINHO_CACHE, max_entradas=MAX_ENTRADAS):
+        self.caminho = caminho
+        self.max_entradas = max_entradas
+        self._local = threading.local()
+        self._escritas = 0
+        self._trinco = threading.Lock()
+        # Por gravar: {fornecedor: [acertos, falhas]} e {(fornecedor, consulta): acesso}
+        self._contadores = {}
+        self._acessos = {}
+        self._descarga = time.monotonic()
+
+    def _ligacao(self):
+        ligacao = getattr(self._local, "ligacao", None)
+        if ligacao is None:
+            pasta = os.path.dirname(self.caminho)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+            ligacao = sqlite3.connect(self.caminho, timeout=10)
+            ligacao.execute("PRAGMA journal_mode=WAL")
+            ligacao.execute("PRAGMA synchronous=NORMAL")
+            ligacao.executescript(_ESQUEMA)
+            self._local.ligacao = ligacao
+        return ligacao
+
+    def obter(self, fornecedor, consulta, predefinido=None):
+        """Valor guardado para a consulta, ou `predefinido` se não existir ou tiver expirado."""
+        agora = time.time()
+        linha = self._ligacao().execute(
+            "SELECT valor, expira, acesso FROM entradas WHERE fornecedor = ? AND consulta = ?",
+            (fornecedor, consulta),
+        ).fetchone()
+        acerto = linha is not None and linha[1] >= agora
+        with self._trinco:
+            contadores = self._contadores.setdefault(fornecedor, [0, 0])
+            contadores[0 if acerto else 1] += 1
+            if acerto and linha[2] < agora - _RESOLUCAO_ACESSO:
+                self._acessos[fornecedor, consulta] = agora
+            descarregar = time.monotonic() - self._descarga >= _INTERVALO_DESCARGA
+        if descarregar:
+            self.descarregar()
+        return json.loads(linha[0]) if acerto else predefinido
+
+    def descarregar(self):
+        """Grava os contadores e os instantes de acesso acumulados em memória."""
+        with self._trinco:
+            contadores, self._contadores = self._contadores, {}
+            acessos, self._acessos = self._acessos, {}
+            self._descarga = time.monotonic()
+        if not contadores and not acessos:
+            return
+        ligacao = self._ligacao()
+        with ligacao:
+            ligacao.executemany(
+                "INSERT INTO contadores (fornecedor, acertos, falhas) VALUES (?, ?, ?) "
+                "ON CONFLICT(fornecedor) DO UPDATE SET "
+                "acertos = acertos + excluded.acertos, falhas = falhas + excluded.falhas",
+                [(fornecedor, acertos, falhas) for fornecedor, (acertos, falhas) in contadores.items()],
+            )
+            ligacao.executemany(
+                "UPDATE entradas SET acesso = MAX(acesso, ?) WHERE fornecedor = ? AND consulta = ?",
+                [(acesso, fornecedor, consulta) for (fornecedor, consulta), acesso in acessos.items()],
+            )
+
+    def guardar(self, fornecedor, consulta, valor, ttl):
+        """Guarda o valor (serializável em JSON) durante `ttl` segundos."""
+        ligacao = self._ligacao()
+        agora = time.time()
+        with ligacao:
+            ligacao.execute(
+                "INSERT OR REPLACE INTO entradas (fornecedor, consulta, valor, expira, acesso) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (fornecedor, consulta, json.dumps(valor, ensure_ascii=False), agora + ttl, agora),
+            )
+        with self._trinco:
+            self._escritas += 1
+            podar = self._escritas % 100 == 0
+        if podar:
+            self.podar()
+
+    def podar(self):
+        """Remove as entradas expiradas e, acima do limite, as usadas há mais tempo."""
+        self.descarregar()
+        ligacao = self._ligacao()
+        with ligacao:
+            ligacao.execute("DELETE FROM entradas WHERE expira < ?", (time.time(),))
+            excesso = ligacao.execute("SELECT COUNT(*) FROM entradas").fetchone()[0] - self.max_entradas
+            if excesso > 0:
+                ligacao.execute(
+                    "DELETE FROM entradas WHERE rowid IN "
+                    "(SELECT rowid FROM entradas ORDER BY acesso LIMIT ?)",
+                    (excesso,),
+                )
+
+    def estatisticas(self):
+        """Acertos e falhas por fornecedor: {fornecedor: (acertos, falhas)}."""
+        self.descarregar()
+        linhas = self._ligacao().execute("SELECT fornecedor, acertos, falhas FROM contadores")
+        return {fornecedor: (acertos, falhas) for fornecedor, acertos, falhas in linhas}
+
+    def limpar(self):
+        """Apaga todas as entradas e contadores."""
+        with self._trinco:
+            self._contadores.clear()
+            self._acessos.clear()
+        ligacao = self._ligacao()
+        with ligacao:
+            ligacao.execute("DELETE FROM entradas")
+            ligacao.execute("DELETE FROM contadores")
+
+
+class PedidosEmCurso:
+    """
+    Junta consultas idênticas em simultâneo (singleflight): enquanto uma
+    chave está a ser consultada, quem pedir a mesma chave espera por essa
+    consulta e recebe o mesmo resultado (ou a mesma exceção), sem novo
+    pedido ao fornecedor.
+    """
+
+    def __init__(self):
+        self._trinco = threading.Lock()
+        self._em_curso = {}
+        self.partilhados = Counter()
+
+    def executar(self, chave, funcao, *args, **kwargs):
+        with self._trinco:
+            pedido = self._em_curso.get(chave)
+            if pedido is None:
+                pedido = self._em_curso[chave] = _Pedido()
+                dono = True
+            else:
+                self.partilhados[chave[0]] += 1
+                dono = False
+
+        if not dono:
+            pedido.pronto.wait()
+            if pedido.erro is not None:
+                raise pedido.erro
+            return pedido.valor
+
+        try:
+            pedido.valor = funcao(*args, **kwargs)
+        except BaseException as e:
+            pedido.erro = e
+            raise
+        finally:
+            with self._trinco:
+                del self._em_curso[chave]
+            pedido.pronto.set()
+        return pedido.valor
+
+
+class _Pedido:
+    __slots__ = ("pronto", "valor", "erro")
+
+    def __init__(self):
+        self.pronto = threading.Event()
+        self.valor = None
+        self.erro = None
+
+
+_cache = None
+_em_curso = PedidosEmCurso()
+
+
+def obter_cache():
+    """Cache partilhada por todos os fornecedores deste processo."""
+    global _cache
+    if _cache is None:
+        _cache = CacheDisco()
+        atexit.register(_descarregar_ao_sair, _cache)
+    return _cache
+
+
+def _descarregar_ao_sair(cache):
+    # Os contadores ainda em memória são gravados quando o processo termina
+    try:
+        cache.descarregar()
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def pedidos_partilhados():
+    """Consultas poupadas por fornecedor, por terem esperado por outra igual em curso."""
+    return dict(_em_curso.partilhados)
+
+
+def em_cache(fornecedor, ttl=TTL_POSITIVO, ttl_negativo=TTL_NEGATIVO, em_erro=_SEM_VALOR):
+    """
+    Decorador que guarda na cache em disco o resultado de uma consulta.
+
+    A chave é o nome do fornecedor mais os argumentos da chamada. Resultados
+    vazios ou falsos ficam guardados durante `ttl_negativo`. Erros nunca são
+    guardados: se `em_erro` for indicado, é devolvido em vez da exceção.
+    Chamadas iguais em simultâneo (ex.: de várias sessões) partilham uma só
+    consulta ao fornecedor.
+
+    A função decorada ganha `guardado(*args)` e `guardar(valor, *args)`, para
+    consultar ou preencher a cache sem chamar o fornecedor.
+    """
+    def decorador(funcao):
+        @wraps(funcao)
+        def envolvida(*args, **kwargs):
+            consulta = _chave(args, kwargs)
+            valor = obter_cache().obter(fornecedor, consulta, _SEM_VALOR)
+            if valor is not _SEM_VALOR:
+                return valor
+            try:
+                return _em_curso.executar((fornecedor, consulta), consultar, *args, **kwargs)
+            except Exception:
+                if em_erro is _SEM_VALOR:
+                    raise
+                return em_erro
+
+        def consultar(*args, **kwargs):
+            # Guarda antes de libertar quem espera, para os seguintes acertarem na cache
+            valor = funcao(*args, **kwargs)
+            guardar(valor, *args, **kwargs)
+            return valor
+
+        def guardado(*args, **kwargs):
+            """(encontrado, valor) já guardado para estes argumentos, sem consultar o fornecedor."""
+            valor = obter_cache().obter(fornecedor, _chave(args, kwargs), _SEM_VALOR)
+            return (False, None) if valor is _SEM_VALOR else (True, valor)
+
+        def guardar(valor, *args, **kwargs):
+            """Guarda um resultado obtido por outra via (ex.: consulta em lote)."""
+            obter_cache().guardar(fornecedor, _chave(args, kwargs), valor, ttl if valor else ttl_negativo)
+
+        envolvida.guardado = guardado
+        envolvida.guardar = guardar
+        return envolvida
+    return decorador
+
+
+def _chave(args, kwargs):
+    return json.dumps([args, sorted(kwargs.items())], ensure_ascii=False)
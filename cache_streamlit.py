@@ -0,0 +1,137 @@
+import os
+import copy
+import streamlit as st
+
+# Os módulos de cada ferramenta só são importados dentro das funções que os
+# usam, para que cada página carregue apenas o que precisa
+
+# Resultados guardados pelo Streamlit, partilhados por todas as sessões:
+# prazo em segundos e número máximo de entradas por função
+TTL_RESULTADOS = int(os.environ.get("PASSATEMPOS_TTL_RESULTADOS", 3600))
+MAX_RESULTADOS = int(os.environ.get("PASSATEMPOS_MAX_RESULTADOS", 500))
+
+_resultados = st.cache_data(ttl=TTL_RESULTADOS, max_entries=MAX_RESULTADOS, show_spinner=False)
+
+# Avisos das páginas quando faltam os dados locais (ver "Dados locais" no README)
+AVISO_SEM_LEXICO = (
+    "O léxico local não está instalado (dados/palavras_pt.txt), por isso as pesquisas locais "
+    "não têm palavras. Vê a secção «Dados locais» do README."
+)
+AVISO_SEM_TESAURO = (
+    "O tesauro local não está instalado (dados/th_pt_PT.dat): os sinónimos vêm só das fontes online."
+)
+
+
+# Recursos: um só objeto por processo, criado na primeira sessão que o usa
+
+@st.cache_resource(show_spinner="A carregar o léxico...")
+def lexico():
+    from lexico import carregar_lexico
+    return carregar_lexico()
+
+
+@st.cache_resource(show_spinner="A carregar o índice de padrões...")
+def indice_padroes():
+    from padroes import carregar_indice_padroes
+    return carregar_indice_padroes()
+
+
+@st.cache_resource(show_spinner="A carregar o tesauro...")
+def tesauro():
+    from tesauro import carregar_tesauro
+    return carregar_tesauro()
+
+
+@st.cache_resource
+def validador():
+    """Validador partilhado: o limite de pedidos por host vale para todas as sessões."""
+    from validacao import ValidadorConcorrente
+    return ValidadorConcorrente(lexico=lexico())
+
+
+# Resultados de fornecedores e solucionadores
+
+def sinonimos(palavra, numero_letras=None):
+    """
+    Sem st.cache_data: a lista é cortada pelo orçamento de tempo dos
+    sinónimos e ficaria parcial para todas as sessões, enquanto a cache em
+    disco recebe depois a resposta completa (e junta os pedidos em curso).
+    """
+    from consultas import obter_sinonimos_combinados
+    return obter_sinonimos_combinados(palavra, numero_letras)
+
+
+@_resultados
+def palavras_com_padrao(padrao, pista=None):
+    from padroes import procurar_padrao
+    return procurar_padrao(padrao, pista, indice_padroes())
+
+
+@_resultados
+def _palavras_validas_locais(letras, tamanho, molde, modo):
+    from palavras_wow import gerar_palavras_validas
+    return gerar_palavras_validas(letras, tamanho, molde, modo)
+
+
+def palavras_validas(letras, tamanho, molde=None, modo="lexico"):
+    """Só os modos locais ficam guardados; os online dependem de fornecedores e da cache em disco."""
+    from palavras_wow import MODOS_LOCAIS, gerar_palavras_validas
+    if modo in MODOS_LOCAIS:
+        return _palavras_validas_locais(letras, tamanho, molde, modo)
+    return gerar_palavras_validas(letras, tamanho, molde, modo, validador())
+
+
+@_resultados
+def _palavras_todos_tamanhos_locais(letras, modo):
+    from palavras_wow import gerar_todos_tamanhos
+    return list(gerar_todos_tamanhos(letras, modo))
+
+
+def palavras_todos_tamanhos(letras, modo="lexico"):
+    """
+    Palavras de todos os tamanhos. Nos modos online devolve o gerador, para
+    que a página mostre cada tamanho à medida que os pedidos respondem.
+    """
+    from palavras_wow import MODOS_LOCAIS, gerar_todos_tamanhos
+    if modo in MODOS_LOCAIS:
+        return _palavras_todos_tamanhos_locais(letras, modo)
+    return gerar_todos_tamanhos(letras, modo, validador())
+
+
+@_resultados
+def solucoes_tabuleiro(letras, texto, max_solucoes=2):
+    from wow_tabuleiro import ler_tabuleiro, resolver_tabuleiro
+    return resolver_tabuleiro(letras, ler_tabuleiro(texto), lexico(), max_solucoes)
+
+
+@_resultados
+def solucoes_grelha(texto, pistas, max_solucoes=2):
+    # Uma pesquisa que esgota o tempo lança TempoEsgotado e não fica guardada
+    from wow_tabuleiro import ler_tabuleiro
+    from grelha_cruzadas import resolver_grelha
+    return resolver_grelha(ler_tabuleiro(texto), pistas, indice_padroes(), max_solucoes)
+
+
+@_resultados
+def analise_x_wing(texto):
+    """(grelha com candidatos, eliminações, grelha após o X-Wing), ou None se o tabuleiro for inválido."""
+    from x_wing_solver import parse_sudoku, fill_candidates, find_x_wings, apply_x_wing
+
+    try:
+        grid = fill_candidates(parse_sudoku(texto))
+    except ValueError:
+        return None
+    eliminations = find_x_wings(grid)
+    _, updated_grid = apply_x_wing(copy.deepcopy(grid))
+    return grid, eliminations, updated_grid
+
+
+@_resultados
+def solucoes_sudoku(texto, max_solucoes=2):
+    """Soluções do Sudoku (até `max_solucoes`), ou None se o tabuleiro for inválido."""
+    from sudoku_solver import solve
+
+    try:
+        return solve(texto, max_solucoes)
+    except ValueError:
+        return None
@@ -0,0 +1,160 @@
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from cache import em_cache
+from fornecedores import DATAMUSE, DICIONARIO, DICIO
+from tesauro import carregar_tesauro
+
+# Sinónimos: o tesauro local chega se der pelo menos MINIMO_SINONIMOS palavras;
+# senão o dicio é lançado se a Datamuse não responder em ATRASO_DICIO segundos,
+# e junta-se o que chegar dentro de ORCAMENTO_SINONIMOS segundos
+MINIMO_SINONIMOS = 5
+ATRASO_DICIO = 0.3
+ORCAMENTO_SINONIMOS = 2.5
+
+# Palavras pedidas à Datamuse para uma pista das Cruzadas; todas as consultas da
+# pista (secções, ordenação do padrão, grelha) usam o mesmo valor para partilhar
+# a cache e os pedidos em curso
+MAXIMO_PISTA = 50
+
+# Pedidos que podem sobreviver a quem os lançou (terminam só para a cache)
+_segundo_plano = ThreadPoolExecutor(max_workers=32)
+
+
+def filtrar_por_tamanho(palavras, num_letras=None):
+    """Mantém só as palavras com `num_letras` letras (se indicado)."""
+    if num_letras:
+        return [w for w in palavras if len(w) == num_letras]
+    return palavras
+
+
+@em_cache("datamuse", em_erro=[])
+def consultar_datamuse(relacao, palavra, maximo):
+    """Palavras devolvidas pela Datamuse para uma relação (ex.: `rel_syn`, `ml`)."""
+    params = {relacao: palavra, "max": maximo}
+    resultado = DATAMUSE.obter(params=params).confirmar()
+    return [item["word"] for item in resultado.json()]
+
+
+def obter_sinonimos(palavra, num_letras=None):
+    return filtrar_por_tamanho(consultar_datamuse("rel_syn", palavra, MAXIMO_PISTA), num_letras)
+
+
+def obter_relacionadas(palavra, num_letras=None):
+    return filtrar_por_tamanho(consultar_datamuse("ml", palavra, MAXIMO_PISTA), num_letras)
+
+
+@em_cache("dictionaryapi", em_erro=[])
+def obter_definicoes(palavra):
+    resultado = DICIONARIO.obter(palavra).confirmar(404)
+    if resultado.estado == 404:
+        return []
+    try:
+        dados = resultado.json()
+        definicoes = []
+        for sentido in dados[0]['meanings']:
+            for definicao in sentido['definitions']:
+                definicoes.append(definicao['definition'])
+        return definicoes[:3]
+    except Exception:
+        return []
+
+
+# Tesauro local
+def obter_sinonimos_tesauro(palavra, numero_letras=None):
+    return carregar_tesauro().sinonimos(palavra, numero_letras)
+
+
+# Datamuse
+def obter_sinonimos_datamuse(palavra, numero_letras=None):
+    return filtrar_por_tamanho(consultar_datamuse("rel_syn", palavra, 100), numero_letras)
+
+
+# Dicio.com.br (scraping)
+# Só interessa o bloco dos sinónimos: a leitura da página pára quando ele fecha
+_BLOCO_SINONIMOS_DICIO = re.compile(r'<p class="adicional sinonimos"[^>]*>.*?</p>', re.S)
+
+
+def extrair_sinonimos_dicio(html):
+    """Sinónimos do bloco `<p class="adicional sinonimos">` de uma página (ou fragmento) do dicio."""
+    # O bs4 só é carregado quando há mesmo uma página do dicio para analisar
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    so_sinonimos = SoupStrainer("p", class_="adicional sinonimos")
+    soup = BeautifulSoup(html, "html.parser", parse_only=so_sinonimos)
+    bloco = soup.find("p", class_="adicional sinonimos")
+    if not bloco:
+        return []
+    texto = bloco.get_text(strip=True)
+    partes = texto.split(":")
+    if len(partes) < 2:
+        return []
+    return [s.strip() for s in partes[1].split(",")]
+
+
+@em_cache("dicio", em_erro=[])
+def consultar_dicio(palavra):
+    """Lista de sinónimos da página do dicio.com.br."""
+    resultado = DICIO.obter(f"{palavra.lower()}/", ate=_BLOCO_SINONIMOS_DICIO).confirmar(404)
+    if resultado.estado == 404:
+        return []
+    # Analisa só o fragmento; se o bloco tiver outra forma, a página lida inteira
+    bloco = _BLOCO_SINONIMOS_DICIO.search(resultado.texto)
+    return extrair_sinonimos_dicio(bloco.group() if bloco else resultado.texto)
+
+
+def obter_sinonimos_dicio(palavra, numero_letras=None):
+    return filtrar_por_tamanho(consultar_dicio(palavra), numero_letras)
+
+
+def obter_sinonimos_combinados(palavra, numero_letras=None, minimo=MINIMO_SINONIMOS,
+                               atraso=ATRASO_DICIO, orcamento=ORCAMENTO_SINONIMOS):
+    """
+    Sinónimos do tesauro local, completados pela Datamuse e pelo dicio.
+
+    A Datamuse é pedida logo. O dicio é lançado quando ela responde com
+    menos de `minimo` palavras ou ao fim de `atraso` segundos sem resposta,
+    em vez de esperar por ela. Junta-se o que chegar até `orcamento`
+    segundos; os pedidos ainda por começar são cancelados e os que já
+    estavam em curso acabam em segundo plano e ficam só na cache.
+    """
+    resultados = dict.fromkeys(obter_sinonimos_tesauro(palavra, numero_letras))
+    if len(resultados) >= minimo:
+        return list(resultados)
+
+    fim = time.monotonic() + orcamento
+    pendentes = {_segundo_plano.submit(obter_sinonimos_datamuse, palavra, numero_letras)}
+    dicio_lancado = False
+    try:
+        while pendentes:
+            espera = fim - time.monotonic()
+            if not dicio_lancado:
+                espera = min(espera, atraso)
+            feitos, pendentes = wait(pendentes, timeout=max(espera, 0), return_when=FIRST_COMPLETED)
+            for futuro in feitos:
+                resultados.update(dict.fromkeys(futuro.result()))
+            if len(resultados) >= minimo or time.monotonic() >= fim:
+                break
+            if not dicio_lancado:
+                pendentes.add(_segundo_plano.submit(obter_sinonimos_dicio, palavra, numero_letras))
+                dicio_lancado = True
+    finally:
+        for futuro in pendentes:
+            futuro.cancel()
+    return list(resultados)
+
+
+def pesquisar_pista(palavra, num_letras=None):
+    """
+    Corre em paralelo as definições, os sinónimos e as palavras relacionadas
+    e gera (secção, resultados) à medida que cada consulta termina.
+    """
+    consultas = {
+        "definicoes": (obter_definicoes, (palavra,)),
+        "sinonimos": (obter_sinonimos, (palavra, num_letras)),
+        "relacionadas": (obter_relacionadas, (palavra, num_letras)),
+    }
+    with ThreadPoolExecutor(max_workers=len(consultas)) as executor:
+        futuros = {executor.submit(funcao, *args): seccao for seccao, (funcao, args) in consultas.items()}
+        for futuro in as_completed(futuros):
+            yield futuros[futuro], futuro.result()
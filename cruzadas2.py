@@ -1,66 +1,93 @@
 import streamlit as st
-import requests
+from consultas import pesquisar_pista
+from cache_streamlit import AVISO_SEM_LEXICO, lexico, palavras_com_padrao, solucoes_grelha
+from wow_tabuleiro import TempoEsgotado, ler_tabuleiro, preencher_tabuleiro
 
-def obter_sinonimos(palavra, num_letras=None):
-    url = "https://api.datamuse.com/words"
-    params = {"rel_syn": palavra, "max": 50}
-    resposta = requests.get(url, params=params)
-    if resposta.status_code == 200:
-        lista = [item["word"] for item in resposta.json()]
-        if num_letras:
-            lista = [w for w in lista if len(w) == num_letras]
-        return lista
-    return []
-
-def obter_relacionadas(palavra, num_letras=None):
-    url = "https://api.datamuse.com/words"
-    params = {"ml": palavra, "max": 50}
-    resposta = requests.get(url, params=params)
-    if resposta.status_code == 200:
-        lista = [item["word"] for item in resposta.json()]
-        if num_letras:
-            lista = [w for w in lista if len(w) == num_letras]
-        return lista
-    return []
-
-def obter_definicoes(palavra):
-    url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{palavra}"
-    resposta = requests.get(url)
-    if resposta.status_code == 200:
-        try:
-            dados = resposta.json()
-            definicoes = []
-            for sentido in dados[0]['meanings']:
-                for definicao in sentido['definitions']:
-                    definicoes.append(definicao['definition'])
-            return definicoes[:3]
-        except Exception:
-            return []
-    return []
+# Máximo de palavras mostradas para um padrão de letras conhecidas
+MAX_PADRAO = 60
 
 # Interface do Streamlit
 st.title("🔠 Ajuda para Palavras Cruzadas")
 palavra = st.text_input("Insere uma palavra ou pista curta:")
 num_letras = st.number_input("Número de letras esperado (opcional):", min_value=1, max_value=30, step=1, format="%d", value=None)
+padrao = st.text_input("Letras conhecidas (opcional, ex.: c?s?):", key="cruz_padrao").strip()
+if padrao and not num_letras:
+    num_letras = len(padrao)
 
 if palavra:
     st.markdown(f"### 🔍 Resultados para: `{palavra}`")
     
-    definicoes = obter_definicoes(palavra)
-    if definicoes:
-        st.subheader("📘 Definições")
-        for d in definicoes:
-            st.markdown(f"- {d}")
+    # As três consultas correm em paralelo; cada secção aparece quando chega
+    seccoes = {"definicoes": st.empty(), "sinonimos": st.empty(), "relacionadas": st.empty()}
+    encontrado = False
+    for seccao, resultados in pesquisar_pista(palavra, num_letras):
+        if not resultados:
+            continue
+        encontrado = True
+        with seccoes[seccao].container():
+            if seccao == "definicoes":
+                st.subheader("📘 Definições")
+                for d in resultados:
+                    st.markdown(f"- {d}")
+            elif seccao == "sinonimos":
+                st.subheader("🟢 Sinónimos")
+                st.markdown(", ".join(resultados))
+            else:
+                st.subheader("🔵 Palavras relacionadas")
+                st.markdown(", ".join(resultados))
 
-    sinonimos = obter_sinonimos(palavra, num_letras)
-    if sinonimos:
-        st.subheader("🟢 Sinónimos")
-        st.markdown(", ".join(sinonimos))
+    if padrao and not len(lexico()):
+        st.info(AVISO_SEM_LEXICO)
+    elif padrao:
+        # Palavras do léxico local com as letras conhecidas, ordenadas pela pista
+        candidatas = palavras_com_padrao(padrao, palavra)
+        if candidatas:
+            encontrado = True
+            st.subheader(f"🧩 Palavras com o padrão `{padrao}`")
+            st.markdown(", ".join(candidatas[:MAX_PADRAO]))
+            if len(candidatas) > MAX_PADRAO:
+                st.caption(f"... e mais {len(candidatas) - MAX_PADRAO} palavras.")
 
-    relacionadas = obter_relacionadas(palavra, num_letras)
-    if relacionadas:
-        st.subheader("🔵 Palavras relacionadas")
-        st.markdown(", ".join(relacionadas))
-
-    if not (definicoes or sinonimos or relacionadas):
+    if not encontrado:
         st.warning("⚠️ Nenhuma informação encontrada.")
+
+with st.expander("🗺️ Preencher grelha completa"):
+    st.markdown("""
+    Desenha a grelha com uma linha por fila: `_` para casas por preencher,
+    letras nas casas já conhecidas e `#` nas casas pretas.
+    As pistas são opcionais; as palavras que sugerem são experimentadas primeiro.
+    """)
+    grelha_input = st.text_area("Grelha:", value="____\n_#_#\n____", height=150, key="cruz_grelha")
+    espacos = ler_tabuleiro(grelha_input)
+    pistas = {}
+    for i, espaco in enumerate(espacos):
+        direcao = "horizontal" if espaco.direcao == "H" else "vertical"
+        pistas[i] = st.text_input(
+            f"Pista ({espaco.linha + 1},{espaco.coluna + 1}) {direcao}, {espaco.tamanho} letras:",
+            key=f"cruz_pista_{espaco.direcao}{espaco.linha}_{espaco.coluna}",
+        )
+    if st.button("🧩 Preencher grelha", key="cruz_grelha_botao"):
+        if not espacos:
+            st.warning("A grelha precisa de pelo menos um espaço de 2 ou mais casas.")
+        elif not len(lexico()):
+            st.info(AVISO_SEM_LEXICO)
+        else:
+            try:
+                solucoes = solucoes_grelha(grelha_input, pistas, max_solucoes=2)
+                esgotado = False
+            except TempoEsgotado as e:
+                solucoes, esgotado = e.solucoes, True
+            if not solucoes:
+                if esgotado:
+                    st.warning("⏱️ Tempo esgotado antes de encontrar uma forma de preencher a grelha. Tenta com mais letras ou pistas.")
+                else:
+                    st.warning("Nenhuma forma de preencher a grelha com as palavras disponíveis.")
+            else:
+                if esgotado:
+                    st.info("⏱️ Tempo esgotado antes de confirmar se a solução é única; eis a encontrada.")
+                elif len(solucoes) > 1:
+                    st.info("A grelha tem mais do que uma solução; eis a que melhor segue as pistas.")
+                st.code(preencher_tabuleiro(grelha_input, espacos, solucoes[0]))
+                for espaco, palavra in zip(espacos, solucoes[0]):
+                    direcao = "horizontal" if espaco.direcao == "H" else "vertical"
+                    st.markdown(f"- ({espaco.linha + 1},{espaco.coluna + 1}) {direcao}: **{palavra}**")
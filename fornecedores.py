@@ -0,0 +1,199 @@
+import os
+import json
+import codecs
+import time
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+# (ligação, leitura) em segundos
+TIMEOUT = (3, 3)
+
+# Só se tenta de novo enquanto o pedido não levar mais do que isto (segundos):
+# as falhas rápidas repetem-se, um host lento não
+JANELA_REPETICAO = 1.0
+
+# Tamanho dos blocos lidos quando a resposta é consumida aos poucos
+BLOCO_LEITURA = 16 * 1024
+
+
+class ErroFornecedor(Exception):
+    """Falha de um fornecedor online (rede, estado HTTP ou circuito aberto)."""
+
+
+class Resultado:
+    """Resposta uniforme de qualquer fornecedor; nunca lança exceções por si."""
+
+    __slots__ = ("fornecedor", "estado", "texto", "erro", "duracao")
+
+    def __init__(self, fornecedor, estado=None, texto="", erro=None, duracao=0.0):
+        self.fornecedor = fornecedor
+        self.estado = estado
+        self.texto = texto
+        self.erro = erro
+        self.duracao = duracao
+
+    @property
+    def ok(self):
+        return self.erro is None and self.estado is not None and 200 <= self.estado < 300
+
+    def json(self):
+        return json.loads(self.texto)
+
+    def confirmar(self, *aceites):
+        """Lança `ErroFornecedor` se a resposta falhou (salvo estados em `aceites`)."""
+        if self.ok or (self.erro is None and self.estado in aceites):
+            return self
+        motivo = self.erro or f"estado HTTP {self.estado}"
+        raise ErroFornecedor(f"{self.fornecedor}: {motivo}")
+
+    def __repr__(self):
+        return f"Resultado({self.fornecedor!r}, estado={self.estado}, erro={self.erro!r})"
+
+
+class Disjuntor:
+    """
+    Circuito por fornecedor: após `limite` falhas seguidas deixa de fazer
+    pedidos durante `pausa` segundos; depois deixa passar um pedido de teste.
+    """
+
+    def __init__(self, limite=5, pausa=30):
+        self.limite = limite
+        self.pausa = pausa
+        self.falhas = 0
+        self.aberto_ate = 0.0
+        self._trinco = threading.Lock()
+
+    def permite(self):
+        with self._trinco:
+            if self.falhas < self.limite:
+                return True
+            if time.monotonic() >= self.aberto_ate:
+                # Meio-aberto: um pedido de teste; nova falha volta a abrir
+                self.aberto_ate = time.monotonic() + self.pausa
+                return True
+            return False
+
+    def sucesso(self):
+        with self._trinco:
+            self.falhas = 0
+
+    def falha(self):
+        with self._trinco:
+            self.falhas += 1
+            if self.falhas >= self.limite:
+                self.aberto_ate = time.monotonic() + self.pausa
+
+
+class _RepeticaoComPrazo(Retry):
+    """
+    `Retry` que desiste quando a próxima tentativa começaria depois de
+    `JANELA_REPETICAO` segundos contados do início do pedido.
+    """
+
+    # Início do pedido em curso, por thread (o urllib3 repete na thread que chamou)
+    pedido = threading.local()
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        nova = super().increment(method, url, response, error, _pool, _stacktrace)
+        inicio = getattr(self.pedido, "inicio", None)
+        if inicio is not None:
+            espera = nova.get_backoff_time()
+            if response is not None:
+                espera = max(espera, nova.get_retry_after(response) or 0)
+            if time.monotonic() - inicio + espera > JANELA_REPETICAO:
+                raise MaxRetryError(_pool, url, error)
+        return nova
+
+
+class Fornecedor:
+    """
+    Cliente HTTP de um fornecedor: sessão com ligações persistentes
+    (keep-alive) por host, timeout, novas tentativas com espera exponencial
+    e disjuntor próprio.
+
+    Só se repetem erros de ligação e respostas 429/5xx, e só dentro de
+    `JANELA_REPETICAO`; um timeout de leitura nunca se repete, para que um
+    host lento custe no máximo um timeout.
+    """
+
+    def __init__(self, nome, url, timeout=TIMEOUT, tentativas=2, espera=0.3, ligacoes=16):
+        self.nome = nome
+        self.url = url
+        self.timeout = timeout
+        self.disjuntor = Disjuntor()
+        repeticao = _RepeticaoComPrazo(
+            total=tentativas,
+            read=0,
+            other=0,
+            backoff_factor=espera,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        adaptador = HTTPAdapter(pool_connections=4, pool_maxsize=ligacoes, max_retries=repeticao)
+        self.sessao = requests.Session()
+        self.sessao.headers["User-Agent"] = "passatempos/1.0"
+        self.sessao.mount("http://", adaptador)
+        self.sessao.mount("https://", adaptador)
+
+    def obter(self, caminho="", params=None, ate=None):
+        """
+        GET a `url + caminho`; devolve sempre um `Resultado`.
+
+        Com `ate` (expressão regular compilada) a resposta é lida aos poucos
+        e a leitura pára logo que o texto já recebido a contenha; `texto`
+        fica só com essa parte da página.
+        """
+        if not self.disjuntor.permite():
+            return Resultado(self.nome, erro="circuito aberto")
+        inicio = time.perf_counter()
+        _RepeticaoComPrazo.pedido.inicio = time.monotonic()
+        try:
+            resposta = self.sessao.get(
+                self.url + caminho, params=params, timeout=self.timeout, stream=ate is not None
+            )
+            texto = resposta.text if ate is None else _ler_ate(resposta, ate)
+        except requests.RequestException as e:
+            self.disjuntor.falha()
+            return Resultado(self.nome, erro=str(e), duracao=time.perf_counter() - inicio)
+        if resposta.status_code >= 500 or resposta.status_code == 429:
+            self.disjuntor.falha()
+        else:
+            self.disjuntor.sucesso()
+        return Resultado(self.nome, resposta.status_code, texto, duracao=time.perf_counter() - inicio)
+
+
+def _ler_ate(resposta, expressao):
+    """Lê a resposta por blocos até `expressao` aparecer no texto (ou até ao fim)."""
+    # Sem charset no cabeçalho o requests assumiria ISO-8859-1; as páginas são UTF-8
+    tipo = resposta.headers.get("Content-Type", "")
+    codificacao = resposta.encoding if "charset" in tipo.lower() else "utf-8"
+    descodificador = codecs.getincrementaldecoder(codificacao)(errors="replace")
+    partes = []
+    try:
+        for bloco in resposta.iter_content(BLOCO_LEITURA):
+            partes.append(descodificador.decode(bloco))
+            texto = "".join(partes)
+            if expressao.search(texto):
+                return texto
+            partes = [texto]
+        partes.append(descodificador.decode(b"", final=True))
+        return "".join(partes)
+    finally:
+        # Fechar a meio descarta a ligação em vez de ler o resto da página
+        resposta.close()
+
+
+def _url(variavel, predefinido):
+    # Os endereços podem apontar para um servidor local de testes
+    return os.environ.get(variavel, predefinido)
+
+
+DATAMUSE = Fornecedor("datamuse", _url("PASSATEMPOS_URL_DATAMUSE", "https://api.datamuse.com/words"))
+DICIONARIO = Fornecedor("dictionaryapi", _url("PASSATEMPOS_URL_DICIONARIO", "https://api.dictionaryapi.dev/api/v2/entries/en/"))
+DICIO = Fornecedor("dicio", _url("PASSATEMPOS_URL_DICIO", "https://www.dicio.com.br/"))
+PRIBERAM = Fornecedor("priberam", _url("PASSATEMPOS_URL_PRIBERAM", "https://dicionario.priberam.org/"))
+WIKTIONARY = Fornecedor("wiktionary", _url("PASSATEMPOS_URL_WIKTIONARY", "https://pt.wiktionary.org/w/api.php"))
@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+from lexico import dobrar
+from consultas import obter_sinonimos, obter_relacionadas
+from padroes import carregar_indice_padroes, normalizar_padrao
+from wow_tabuleiro import resolver_espacos
+
+# Tempo máximo (segundos) da pesquisa de uma grelha
+LIMITE_TEMPO = 10
+
+
+def respeita_molde(palavra, molde):
+    """Indica se a palavra (sem acentos) tem o tamanho e as letras conhecidas do molde."""
+    chave, molde = dobrar(palavra.lower()), normalizar_padrao(molde)
+    return len(chave) == len(molde) and all(m == "?" or m == c for m, c in zip(molde, chave))
+
+
+def sugestoes_pista(pista, molde):
+    """Sinónimos e palavras relacionadas da pista que cabem no molde, por ordem da Datamuse."""
+    tamanho = len(molde)
+    candidatas = obter_sinonimos(pista, tamanho) + obter_relacionadas(pista, tamanho)
+    return [
+        palavra.lower() for palavra in dict.fromkeys(candidatas)
+        if palavra.isalpha() and respeita_molde(palavra, molde)
+    ]
+
+
+def dominios_grelha(espacos, pistas=None, indice=None):
+    """
+    Candidatas de cada espaço: primeiro as sugeridas pela pista (se houver),
+    depois as palavras do léxico local com o mesmo padrão. As pistas são
+    consultadas em paralelo.
+    """
+    indice = carregar_indice_padroes() if indice is None else indice
+    pistas = pistas or {}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futuros = {
+            i: executor.submit(sugestoes_pista, pistas[i].strip(), espaco.molde)
+            for i, espaco in enumerate(espacos)
+            if pistas.get(i, "").strip()
+        }
+        sugeridas = {i: futuro.result() for i, futuro in futuros.items()}
+
+    dominios = []
+    for i, espaco in enumerate(espacos):
+        vistas, dominio = set(), []
+        # Uma só forma por chave sem acentos, a sugerida pela pista se houver
+        candidatas = sugeridas.get(i, []) + indice.procurar(espaco.molde)
+        if "_" not in espaco.molde:
+            # Espaço já todo preenchido: vale mesmo que não esteja no léxico
+            candidatas.append(espaco.molde)
+        for palavra in candidatas:
+            chave = dobrar(palavra)
+            if chave not in vistas:
+                vistas.add(chave)
+                dominio.append(palavra)
+        dominios.append(dominio)
+    return dominios
+
+
+def resolver_grelha(espacos, pistas=None, indice=None, max_solucoes=1, limite_tempo=LIMITE_TEMPO):
+    """
+    Preenche todos os espaços de uma grelha de palavras cruzadas.
+
+    `pistas` é um dicionário {índice do espaço: pista}; as palavras sugeridas
+    pela pista são experimentadas antes das restantes. Devolve até
+    `max_solucoes` soluções, cada uma uma lista com a palavra de cada espaço,
+    ou lança `TempoEsgotado` se a pesquisa passar de `limite_tempo` segundos.
+    """
+    dominios = dominios_grelha(espacos, pistas, indice)
+    return resolver_espacos(espacos, dominios, max_solucoes, limite_tempo)
@@ -0,0 +1,263 @@
+import os
+import sys
+import struct
+import bisect
+import unicodedata
+from collections import deque
+from functools import lru_cache
+from vetores import vetor, escrever_vetores, mapear, ler_vetores
+
+# Lista de palavras (uma por linha, UTF-8). Pode ser indicada por variável de ambiente.
+CAMINHO_LEXICO = os.environ.get(
+    "PASSATEMPOS_LEXICO",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados", "palavras_pt.txt"),
+)
+
+_MAGIA = b"PTLEX\x00\x00\x02"
+_CABECALHO = struct.Struct("<8sIIII")
+
+# Valores de `terminal`: a própria chave é palavra e/ou há formas acentuadas
+_PALAVRA = 1
+_VARIANTES = 2
+
+
+def dobrar(palavra):
+    """Remove os diacríticos da palavra: 'ação' -> 'acao'."""
+    if palavra.isascii():
+        return palavra
+    decomposta = unicodedata.normalize("NFD", palavra)
+    return "".join(c for c in decomposta if not unicodedata.combining(c))
+
+
+class Lexico:
+    """
+    Trie de palavras guardada em vetores planos, para ocupar pouca memória
+    e poder ser mapeada diretamente de um ficheiro binário.
+
+    As chaves da trie são as palavras sem acentos (ver `dobrar`), de modo que
+    uma só consulta encontra todas as formas acentuadas. O nó `n` tem as
+    arestas no intervalo [primeira[n], primeira[n+1]), ordenadas pela letra;
+    `destinos` indica o nó de chegada de cada aresta e `terminal[n]` diz se a
+    chave até `n` é palavra (`_PALAVRA`) e/ou tem formas acentuadas
+    (`_VARIANTES`, guardadas em `variantes`). O nó 0 é a raiz.
+    """
+
+    __slots__ = ("_primeira", "_letras", "_destinos", "_terminal", "_variantes", "_mmap", "total")
+
+    def __init__(self, primeira, letras, destinos, terminal, variantes, total, ficheiro_mapeado=None):
+        self._primeira = primeira
+        self._letras = letras
+        self._destinos = destinos
+        self._terminal = terminal
+        self._variantes = variantes
+        self._mmap = ficheiro_mapeado
+        self.total = total
+
+    # Construção -------------------------------------------------------------
+
+    @classmethod
+    def de_palavras(cls, palavras):
+        """Constrói o léxico a partir de um iterável de palavras."""
+        raiz = {}
+        variantes = {}
+        total = 0
+        for palavra in palavras:
+            chave = dobrar(palavra)
+            no = raiz
+            for letra in chave:
+                no = no.setdefault(letra, {})
+            marca = no.get("", 0)
+            if palavra == chave:
+                if not marca & _PALAVRA:
+                    total += 1
+                no[""] = marca | _PALAVRA
+            else:
+                formas = variantes.setdefault(chave, [])
+                if palavra not in formas:
+                    formas.append(palavra)
+                    total += 1
+                no[""] = marca | _VARIANTES
+
+        # Percurso em largura: os filhos de cada nó ficam contíguos nos vetores
+        primeira, letras, destinos, terminal = vetor([0]), vetor(), vetor(), bytearray()
+        fila = deque([raiz])
+        proximo = 1
+        while fila:
+            no = fila.popleft()
+            terminal.append(no.get("", 0))
+            for letra in sorted(l for l in no if l):
+                letras.append(ord(letra))
+                destinos.append(proximo)
+                proximo += 1
+                fila.append(no[letra])
+            primeira.append(len(letras))
+        variantes = {chave: tuple(sorted(formas)) for chave, formas in variantes.items()}
+        return cls(primeira, letras, destinos, terminal, variantes, total)
+
+    @classmethod
+    def de_ficheiro_texto(cls, caminho):
+        """Lê uma lista de palavras (uma por linha) e constrói o léxico."""
+        with open(caminho, encoding="utf-8") as f:
+            return cls.de_palavras(normalizar_lista(f))
+
+    # Forma binária ----------------------------------------------------------
+
+    def guardar(self, caminho):
+        """Grava o léxico no formato binário lido por `Lexico.abrir`."""
+        n_nos = len(self._terminal)
+        variantes = "\n".join(
+            " ".join([chave, *formas]) for chave, formas in sorted(self._variantes.items())
+        ).encode("utf-8")
+        temporario = caminho + ".tmp"
+        with open(temporario, "wb") as f:
+            f.write(_CABECALHO.pack(_MAGIA, n_nos, len(self._letras), self.total, len(variantes)))
+            escrever_vetores(f, (self._primeira, self._letras, self._destinos))
+            f.write(bytes(self._terminal))
+            f.write(variantes)
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def abrir(cls, caminho):
+        """
+        Abre um léxico binário mapeando a trie em memória (sem copiar os
+        dados); só a tabela, pequena, de formas acentuadas é lida para um dict.
+        """
+        dados, vista, (n_nos, n_arestas, total, n_variantes) = mapear(caminho, _CABECALHO, _MAGIA, "léxico")
+        try:
+            # A seguir aos vetores vêm as marcas dos nós e a tabela de formas acentuadas
+            partes, inicio = ler_vetores(
+                vista, _CABECALHO.size, (n_nos + 1, n_arestas, n_arestas), resto=n_nos + n_variantes
+            )
+        except ValueError:
+            vista.release()
+            dados.close()
+            raise
+        terminal = vista[inicio:inicio + n_nos]
+        inicio += n_nos
+        variantes = {}
+        for linha in bytes(vista[inicio:inicio + n_variantes]).decode("utf-8").splitlines():
+            chave, *formas = linha.split(" ")
+            variantes[chave] = tuple(formas)
+        return cls(*partes, terminal, variantes, total, ficheiro_mapeado=dados)
+
+    # Consultas --------------------------------------------------------------
+
+    def __len__(self):
+        return self.total
+
+    def __contains__(self, palavra):
+        chave = dobrar(palavra)
+        no = self.no_prefixo(chave)
+        if no < 0:
+            return False
+        if palavra == chave:
+            return bool(self._terminal[no] & _PALAVRA)
+        return palavra in self._variantes.get(chave, ())
+
+    def formas(self, palavra):
+        """Todas as palavras do léxico que, sem acentos, se escrevem como `palavra`."""
+        chave = dobrar(palavra)
+        no = self.no_prefixo(chave)
+        return self.formas_no(no, chave) if no >= 0 else []
+
+    def formas_no(self, no, chave):
+        """Palavras associadas ao nó `no`, cuja chave (sem acentos) é `chave`."""
+        marca = self._terminal[no]
+        formas = [chave] if marca & _PALAVRA else []
+        if marca & _VARIANTES:
+            formas.extend(self._variantes[chave])
+        return formas
+
+    def filho(self, no, letra):
+        """Nó alcançado a partir de `no` pela `letra`, ou -1 se não existir."""
+        inicio, fim = self._primeira[no], self._primeira[no + 1]
+        codigo = ord(letra)
+        i = bisect.bisect_left(self._letras, codigo, inicio, fim)
+        if i < fim and self._letras[i] == codigo:
+            return self._destinos[i]
+        return -1
+
+    def filhos(self, no):
+        """Pares (letra, nó) que saem de `no`, por ordem alfabética."""
+        for i in range(self._primeira[no], self._primeira[no + 1]):
+            yield chr(self._letras[i]), self._destinos[i]
+
+    def terminal(self, no):
+        """Indica se o caminho até `no` forma uma palavra (com ou sem acentos)."""
+        return self._terminal[no] != 0
+
+    def no_prefixo(self, prefixo, no=0):
+        """Nó correspondente ao `prefixo` sem acentos (a partir de `no`), ou -1."""
+        for letra in prefixo:
+            no = self.filho(no, letra)
+            if no < 0:
+                return -1
+        return no
+
+    def tem_prefixo(self, prefixo):
+        """Indica se alguma palavra do léxico começa por `prefixo`."""
+        return self.no_prefixo(dobrar(prefixo)) >= 0
+
+    def palavras(self, prefixo=""):
+        """Enumera as palavras que começam por `prefixo`, por ordem da chave sem acentos."""
+        prefixo = dobrar(prefixo)
+        no = self.no_prefixo(prefixo)
+        if no < 0:
+            return
+        pilha = [(no, prefixo)]
+        while pilha:
+            no, atual = pilha.pop()
+            if self._terminal[no]:
+                yield from self.formas_no(no, atual)
+            pilha.extend((destino, atual + letra) for letra, destino in reversed(list(self.filhos(no))))
+
+
+def normalizar_lista(linhas):
+    """Normaliza linhas de uma lista de palavras: minúsculas, só letras."""
+    for linha in linhas:
+        palavra = linha.strip().lower()
+        if palavra and palavra.isalpha():
+            yield palavra
+
+
+@lru_cache(maxsize=None)
+def carregar_lexico(caminho=CAMINHO_LEXICO):
+    """
+    Carrega o léxico português.
+
+    Usa a forma binária (`<caminho>.bin`) se existir e estiver atualizada;
+    caso contrário constrói-a a partir da lista de texto. Sem lista de
+    palavras devolve um léxico vazio, e a validação fica toda online.
+    """
+    binario = caminho + ".bin"
+    texto_existe = os.path.exists(caminho)
+    if os.path.exists(binario) and (
+        not texto_existe or os.path.getmtime(binario) >= os.path.getmtime(caminho)
+    ):
+        try:
+            return Lexico.abrir(binario)
+        except ValueError:
+            # Formato antigo: volta a ser gerado a partir da lista
+            if not texto_existe:
+                raise
+    if not texto_existe:
+        return Lexico.de_palavras([])
+
+    lexico = Lexico.de_ficheiro_texto(caminho)
+    try:
+        lexico.guardar(binario)
+    except OSError:
+        pass
+    return lexico
+
+
+if __name__ == "__main__":
+    # Gera a forma binária: python lexico.py palavras.txt [saida.bin]
+    if len(sys.argv) < 2:
+        print("Uso: python lexico.py <lista.txt> [saida.bin]")
+        sys.exit(1)
+    origem = sys.argv[1]
+    destino = sys.argv[2] if len(sys.argv) > 2 else origem + ".bin"
+    lexico = Lexico.de_ficheiro_texto(origem)
+    lexico.guardar(destino)
+    print(f"{len(lexico)} palavras gravadas em {destino}")
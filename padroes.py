@@ -0,0 +1,104 @@
+from collections import defaultdict
+from functools import lru_cache
+from lexico import CAMINHO_LEXICO, carregar_lexico, dobrar
+from consultas import MAXIMO_PISTA, consultar_datamuse
+
+# Caracteres que valem por qualquer letra num padrão ("c?s?", "c_s_", "c.s.")
+CURINGAS = "?_."
+
+
+def normalizar_padrao(padrao):
+    """Padrão em minúsculas e sem acentos, com '?' em todas as posições livres."""
+    return "".join("?" if c in CURINGAS else c for c in dobrar(padrao.strip().lower()))
+
+
+def _bits(mapa):
+    """Gera as posições dos bits a 1 de um inteiro."""
+    while mapa:
+        baixo = mapa & -mapa
+        yield baixo.bit_length() - 1
+        mapa ^= baixo
+
+
+class IndicePadroes:
+    """
+    Índice posicional das palavras do léxico para padrões de letras conhecidas.
+
+    As palavras estão agrupadas por tamanho; para cada (tamanho, posição,
+    letra) há um mapa de bits (um inteiro) com as palavras desse tamanho que
+    têm essa letra nessa posição. Um padrão resolve-se com um AND dos mapas
+    das letras conhecidas, sem percorrer a lista.
+    """
+
+    __slots__ = ("_palavras", "_mapas")
+
+    def __init__(self, palavras_por_tamanho, mapas):
+        self._palavras = palavras_por_tamanho
+        self._mapas = mapas
+
+    @classmethod
+    def de_palavras(cls, palavras):
+        """Constrói o índice a partir de um iterável de palavras."""
+        por_tamanho = defaultdict(list)
+        for palavra in dict.fromkeys(palavras):
+            por_tamanho[len(dobrar(palavra))].append(palavra)
+
+        mapas = {}
+        for tamanho, lista in por_tamanho.items():
+            # Os bits marcam-se num bytearray e só no fim passam a inteiro
+            marcas = defaultdict(lambda: bytearray((len(lista) + 7) // 8))
+            for i, palavra in enumerate(lista):
+                for posicao, letra in enumerate(dobrar(palavra)):
+                    marcas[posicao, letra][i >> 3] |= 1 << (i & 7)
+            for (posicao, letra), bytes_ in marcas.items():
+                mapas[tamanho, posicao, letra] = int.from_bytes(bytes_, "little")
+        return cls(dict(por_tamanho), mapas)
+
+    def __len__(self):
+        return sum(len(lista) for lista in self._palavras.values())
+
+    def procurar(self, padrao):
+        """Palavras com o tamanho do padrão e as letras conhecidas nas posições certas."""
+        padrao = normalizar_padrao(padrao)
+        lista = self._palavras.get(len(padrao))
+        if not lista:
+            return []
+        mapa = (1 << len(lista)) - 1
+        for posicao, letra in enumerate(padrao):
+            if letra != "?":
+                mapa &= self._mapas.get((len(padrao), posicao, letra), 0)
+                if not mapa:
+                    return []
+        return [lista[i] for i in _bits(mapa)]
+
+    def contar(self, padrao):
+        """Número de palavras que respeitam o padrão."""
+        return len(self.procurar(padrao))
+
+
+def ordenar_por_pista(candidatas, pista):
+    """
+    Ordena as candidatas pela pista: primeiro os sinónimos da Datamuse
+    (`rel_syn`), depois as palavras com significado próximo (`ml`) pela
+    ordem da Datamuse, e por fim as restantes por ordem alfabética.
+    """
+    posicoes = {}
+    for peso, relacao in enumerate(("rel_syn", "ml")):
+        for ordem, palavra in enumerate(consultar_datamuse(relacao, pista, MAXIMO_PISTA)):
+            posicoes.setdefault(dobrar(palavra.lower()), (peso, ordem))
+    return sorted(candidatas, key=lambda p: (posicoes.get(dobrar(p), (2, 0)), p))
+
+
+def procurar_padrao(padrao, pista=None, indice=None):
+    """Palavras do léxico local que respeitam o padrão, ordenadas pela pista se indicada."""
+    indice = carregar_indice_padroes() if indice is None else indice
+    candidatas = indice.procurar(padrao)
+    if pista and pista.strip():
+        return ordenar_por_pista(candidatas, pista.strip())
+    return sorted(candidatas)
+
+
+@lru_cache(maxsize=None)
+def carregar_indice_padroes(caminho=CAMINHO_LEXICO):
+    """Índice posicional do léxico em `caminho` (construído em memória na primeira utilização)."""
+    return IndicePadroes.de_palavras(carregar_lexico(caminho).palavras())
@@ -0,0 +1,73 @@
+from lexico import carregar_lexico, dobrar
+from validacao import ValidadorConcorrente, validar_por_padrao
+from anagramas import (
+    permutacoes_distintas, permutacoes_todos_tamanhos,
+    procurar_no_lexico, procurar_todos_tamanhos, carregar_indice_anagramas,
+)
+
+MODOS_PESQUISA = {
+    "Léxico local (rápido)": "lexico",
+    "Índice de anagramas (pré-calculado)": "indice",
+    "Padrão Datamuse (um só pedido)": "padrao",
+    "Dicionários online": "online",
+}
+
+# Modos que só usam dados locais (os outros fazem pedidos aos fornecedores)
+MODOS_LOCAIS = ("lexico", "indice")
+
+
+def palavra_respeita_molde(palavra, molde):
+    """Verifica se a palavra cumpre o molde (letras nas posições corretas, sem olhar a acentos)"""
+    return all(m == "_" or dobrar(m.lower()) == dobrar(p.lower()) for m, p in zip(molde, palavra))
+
+
+def gerar_candidatos(letras, tamanho, molde=None):
+    """Gera as permutações distintas que respeitam o molde"""
+    todas = permutacoes_distintas(letras.lower(), tamanho)
+    if molde:
+        molde = molde.lower()
+        todas = (p for p in todas if palavra_respeita_molde(p, molde))
+    return list(todas)
+
+
+def gerar_palavras_validas(letras, tamanho, molde=None, modo="online", validador=None):
+    """
+    Gera permutações distintas, filtra por molde e por palavras reais.
+
+    No modo "lexico" a pesquisa percorre a trie do léxico local e devolve
+    logo as palavras válidas, sem lista de combinações.
+    """
+    letras = letras.lower()
+    if modo == "lexico":
+        molde = molde.lower() if molde else None
+        return list(procurar_no_lexico(letras, tamanho, carregar_lexico(), molde)), []
+    if modo == "indice":
+        palavras = carregar_indice_anagramas().subanagramas(letras, tamanho, tamanho)
+        if molde:
+            molde = molde.lower()
+            palavras = (p for p in palavras if palavra_respeita_molde(p, molde))
+        return list(palavras), []
+    if modo == "padrao":
+        return validar_por_padrao(letras, tamanho, molde), []
+
+    todas = gerar_candidatos(letras, tamanho, molde)
+
+    # Valida todas as palavras em paralelo
+    palavras_validas = (validador or ValidadorConcorrente()).validar(todas)
+    return palavras_validas, todas
+
+
+def gerar_todos_tamanhos(letras, modo="online", validador=None):
+    """Gera as palavras válidas de todos os tamanhos, à medida que são encontradas"""
+    letras = letras.lower()
+    if modo == "lexico":
+        yield from procurar_todos_tamanhos(letras, carregar_lexico())
+    elif modo == "indice":
+        yield from carregar_indice_anagramas().subanagramas(letras, 3)
+    elif modo == "padrao":
+        for tamanho in range(3, len(letras) + 1):
+            yield from validar_por_padrao(letras, tamanho)
+    else:
+        # Uma só travessia gera os candidatos de todos os tamanhos
+        validador = validador or ValidadorConcorrente()
+        yield from validador.validar_em_fluxo(permutacoes_todos_tamanhos(letras))
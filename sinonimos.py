@@ -1,19 +1,18 @@
 import streamlit as st
-import requests
+from fornecedores import DATAMUSE
 
 def obter_sinonimos(palavra):
-    url = "https://api.datamuse.com/words"
     params = {
         "rel_syn": palavra,
         "max": 10
     }
-    resposta = requests.get(url, params=params)
+    resultado = DATAMUSE.obter(params=params)
 
-    if resposta.status_code == 200:
-        dados = resposta.json()
+    if resultado.ok:
+        dados = resultado.json()
         return [item["word"] for item in dados]
     else:
-        st.error(f"Erro ao aceder à API: {resposta.status_code}")
+        st.error(f"Erro ao aceder à API: {resultado.erro or resultado.estado}")
         return []
 
 # Interface Streamlit
@@ -0,0 +1,191 @@
+"""
+Tabuleiro de Sudoku com candidatos em máscaras de bits.
+
+Cada célula é um índice 0..80 (linha * 9 + coluna). Os valores resolvidos
+ficam em `values` (0 = vazia) e os candidatos das células vazias em `masks`,
+uma máscara de 9 bits em que o bit d-1 corresponde ao dígito d. As células
+resolvidas têm máscara 0, tal como as células com um número na API de listas.
+"""
+from array import array
+
+ALL_DIGITS = 0x1FF
+
+# Unidades (linhas, colunas, blocos) e vizinhos de cada célula, calculados uma vez
+ROWS = tuple(tuple(r * 9 + c for c in range(9)) for r in range(9))
+COLS = tuple(tuple(r * 9 + c for r in range(9)) for c in range(9))
+BOXES = tuple(
+    tuple((3 * (b // 3) + r) * 9 + 3 * (b % 3) + c for r in range(3) for c in range(3))
+    for b in range(9)
+)
+UNITS = ROWS + COLS + BOXES
+ROW_OF = tuple(i // 9 for i in range(81))
+COL_OF = tuple(i % 9 for i in range(81))
+BOX_OF = tuple(3 * (i // 27) + (i % 9) // 3 for i in range(81))
+# Índices em UNITS da linha, coluna e bloco de cada célula
+CELL_UNITS = tuple((ROW_OF[i], 9 + COL_OF[i], 18 + BOX_OF[i]) for i in range(81))
+PEERS = tuple(
+    tuple(sorted(set(ROWS[ROW_OF[i]] + COLS[COL_OF[i]] + BOXES[BOX_OF[i]]) - {i}))
+    for i in range(81)
+)
+
+# Tabelas por máscara: número de bits, dígito de uma máscara com um só bit, e dígitos
+POPCOUNT = bytes(bin(m).count("1") for m in range(512))
+SINGLE_DIGIT = bytes(m.bit_length() if POPCOUNT[m] == 1 else 0 for m in range(512))
+DIGITS_OF = tuple(tuple(d for d in range(1, 10) if m >> (d - 1) & 1) for m in range(512))
+
+
+def bit(digit):
+    """Máscara com o bit do dígito (1-9)."""
+    return 1 << (digit - 1)
+
+
+class Board:
+    """
+    Tabuleiro 9x9 em dois buffers planos de 81 posições.
+
+    Os métodos `fill_candidates`, `find_x_wings` e `apply_x_wing` fazem o
+    mesmo que as funções de x_wing_solver, mas com operações de bits;
+    `from_grid`/`to_grid` convertem de e para a matriz de listas.
+    """
+
+    __slots__ = ("values", "masks")
+
+    def __init__(self, values=None, masks=None):
+        self.values = array("B", values if values is not None else bytes(81))
+        self.masks = array("H", masks if masks is not None else bytes(162))
+
+    # Conversões -------------------------------------------------------------
+
+    @classmethod
+    def parse(cls, board_str):
+        """
+        Lê um tabuleiro em texto ('0' ou '.' nas células vazias).
+
+        As células vazias ficam com todos os candidatos, como em `parse_sudoku`.
+
+        Raises:
+            ValueError: se o tabuleiro não tiver 81 células
+        """
+        board_str = "".join(c for c in board_str if c not in " \n\t").replace(".", "0")
+        if len(board_str) != 81:
+            raise ValueError("O tabuleiro deve ter 81 células")
+        values = array("B", (int(c) for c in board_str))
+        masks = array("H", (0 if v else ALL_DIGITS for v in values))
+        return cls(values, masks)
+
+    @classmethod
+    def from_grid(cls, grid):
+        """Converte uma matriz 9x9 (número, ou lista de candidatos) num tabuleiro."""
+        board = cls()
+        for i in range(81):
+            cell = grid[i // 9][i % 9]
+            if isinstance(cell, int):
+                board.values[i] = cell
+            else:
+                mask = 0
+                for digit in cell:
+                    mask |= bit(digit)
+                board.masks[i] = mask
+        return board
+
+    def to_grid(self):
+        """Matriz 9x9 com o número de cada célula resolvida ou a lista dos seus candidatos."""
+        return [
+            [self.values[i] or list(DIGITS_OF[self.masks[i]]) for i in row]
+            for row in ROWS
+        ]
+
+    def update_grid(self, grid):
+        """Escreve os valores e candidatos deste tabuleiro numa matriz 9x9 existente."""
+        for i in range(81):
+            grid[i // 9][i % 9] = self.values[i] or list(DIGITS_OF[self.masks[i]])
+        return grid
+
+    def copy(self):
+        return Board(self.values, self.masks)
+
+    def __str__(self):
+        return "".join(str(v) if v else "." for v in self.values)
+
+    # Candidatos -------------------------------------------------------------
+
+    def candidates(self, cell):
+        """Dígitos candidatos da célula (vazio se estiver resolvida)."""
+        return DIGITS_OF[self.masks[cell]]
+
+    def fill_candidates(self):
+        """
+        Recalcula os candidatos de todas as células vazias a partir dos
+        números já colocados em cada linha, coluna e bloco.
+        """
+        values, masks = self.values, self.masks
+        used = [0] * 27
+        for i in range(81):
+            if values[i]:
+                b = bit(values[i])
+                for unit in CELL_UNITS[i]:
+                    used[unit] |= b
+        for i in range(81):
+            if not values[i]:
+                r, c, x = CELL_UNITS[i]
+                masks[i] = ALL_DIGITS & ~(used[r] | used[c] | used[x])
+        return self
+
+    # X-Wing -----------------------------------------------------------------
+
+    def _positions(self, units, b):
+        """Para cada unidade, máscara das posições (0-8) das células vazias com o bit `b`."""
+        masks = self.masks
+        result = []
+        for unit in units:
+            positions = 0
+            for k, cell in enumerate(unit):
+                if masks[cell] & b:
+                    positions |= 1 << k
+            result.append(positions)
+        return result
+
+    def find_x_wings(self):
+        """
+        Procura padrões X-Wing por linhas e por colunas.
+
+        Returns:
+            Uma lista de eliminações no formato [(linha, coluna, valor), ...],
+            pela mesma ordem de `x_wing_solver.find_x_wings`
+        """
+        masks = self.masks
+        eliminations = []
+        for lines in (ROWS, COLS):
+            for num in range(1, 10):
+                b = bit(num)
+                positions = self._positions(lines, b)
+                for line1 in range(9):
+                    pair = positions[line1]
+                    if POPCOUNT[pair] != 2:
+                        continue
+                    k1, k2 = DIGITS_OF[pair]
+                    for line2 in range(line1 + 1, 9):
+                        if positions[line2] != pair:
+                            continue
+                        # O dígito fica preso a estas duas linhas nas duas unidades cruzadas:
+                        # sai das outras células dessas unidades
+                        for other in range(9):
+                            if other == line1 or other == line2:
+                                continue
+                            for k in (k1, k2):
+                                cell = lines[other][k - 1]
+                                if masks[cell] & b:
+                                    eliminations.append((ROW_OF[cell], COL_OF[cell], num))
+        return eliminations
+
+    def apply_x_wing(self):
+        """
+        Aplica as eliminações X-Wing encontradas.
+
+        Returns:
+            Um booleano indicando se alguma eliminação foi feita
+        """
+        eliminations = self.find_x_wings()
+        for row, col, val in eliminations:
+            self.masks[row * 9 + col] &= ~bit(val)
+        return bool(eliminations)
@@ -0,0 +1,192 @@
+"""
+Propagação incremental de candidatos num tabuleiro de máscaras de bits.
+
+Em vez de recalcular todos os candidatos (como `fill_candidates`), o motor
+mantém, para cada unidade (linha, coluna, bloco) e dígito, quantas células
+vazias ainda o admitem. Colocar um número ou eliminar um candidato só mexe
+nos 20 vizinhos da célula e nas 3 unidades a que ela pertence, e deixa numa
+fila os "singles" que aparecem pelo caminho.
+"""
+from array import array
+from collections import deque
+
+from sudoku_board import (
+    Board, ALL_DIGITS, UNITS, CELL_UNITS, PEERS, POPCOUNT, SINGLE_DIGIT,
+)
+
+NAKED_SINGLE = "naked single"    # a célula só tem um candidato
+HIDDEN_SINGLE = "hidden single"  # o dígito só cabe numa célula da unidade
+
+
+class Contradiction(ValueError):
+    """O tabuleiro ficou sem solução (célula sem candidatos, dígito sem lugar, ou conflito)."""
+
+
+class Propagator:
+    """
+    Candidatos de um tabuleiro atualizados a cada alteração.
+
+    `counts[u * 9 + d - 1]` é o número de células vazias da unidade `u` que
+    ainda admitem o dígito `d`; `placed[u]` é a máscara dos dígitos já
+    colocados na unidade. `events` recebe tuplos (tipo, célula, dígito).
+    """
+
+    __slots__ = ("board", "counts", "placed", "events")
+
+    def __init__(self):
+        self.board = Board(masks=array("H", [ALL_DIGITS]) * 81)
+        self.counts = array("B", [9]) * (27 * 9)
+        self.placed = array("H", bytes(54))
+        self.events = deque()
+
+    @classmethod
+    def from_board(cls, board):
+        """
+        Motor com os números de `board` colocados e os candidatos das células
+        vazias restringidos às suas máscaras.
+
+        Raises:
+            Contradiction: se os números ou candidatos forem incompatíveis
+        """
+        engine = cls()
+        for cell, value in enumerate(board.values):
+            if value:
+                engine.place(cell, value)
+        for cell, value in enumerate(board.values):
+            if not value:
+                engine.restrict(cell, board.masks[cell])
+        return engine
+
+    @classmethod
+    def parse(cls, board_str):
+        return cls.from_board(Board.parse(board_str))
+
+    def copy(self):
+        """Cópia independente (a fila de eventos não é copiada)."""
+        engine = Propagator.__new__(Propagator)
+        engine.board = self.board.copy()
+        engine.counts = array("B", self.counts)
+        engine.placed = array("H", self.placed)
+        engine.events = deque()
+        return engine
+
+    def solved(self):
+        return all(self.board.values)
+
+    # Alterações -------------------------------------------------------------
+
+    def place(self, cell, digit):
+        """
+        Coloca o dígito na célula e tira-o dos candidatos dos vizinhos.
+
+        Raises:
+            Contradiction: se a célula já tiver outro número ou não admitir o dígito
+        """
+        values, masks, counts = self.board.values, self.board.masks, self.counts
+        if values[cell]:
+            if values[cell] != digit:
+                raise Contradiction(f"célula {cell} já tem {values[cell]}")
+            return
+        b = 1 << (digit - 1)
+        mask = masks[cell]
+        if not mask & b:
+            raise Contradiction(f"{digit} não é candidato da célula {cell}")
+        values[cell] = digit
+        masks[cell] = 0
+        units = CELL_UNITS[cell]
+        placed = self.placed
+        for unit in units:
+            placed[unit] |= b
+            counts[unit * 9 + digit - 1] -= 1
+        # Os outros candidatos da célula deixam de contar nas suas unidades
+        rest = mask & ~b
+        while rest:
+            low = rest & -rest
+            rest ^= low
+            self._decrement(units, low)
+        eliminate = self.eliminate
+        for peer in PEERS[cell]:
+            if masks[peer] & b:
+                eliminate(peer, digit)
+
+    def eliminate(self, cell, digit):
+        """
+        Tira o dígito dos candidatos da célula.
+
+        Returns:
+            True se o candidato existia
+
+        Raises:
+            Contradiction: se a célula ficar sem candidatos ou o dígito sem lugar numa unidade
+        """
+        masks = self.board.masks
+        b = 1 << (digit - 1)
+        mask = masks[cell]
+        if not mask & b:
+            return False
+        mask &= ~b
+        masks[cell] = mask
+        if not mask:
+            raise Contradiction(f"célula {cell} sem candidatos")
+        if POPCOUNT[mask] == 1:
+            self.events.append((NAKED_SINGLE, cell, SINGLE_DIGIT[mask]))
+        self._decrement(CELL_UNITS[cell], b)
+        return True
+
+    def restrict(self, cell, allowed):
+        """Elimina da célula todos os candidatos fora da máscara `allowed`."""
+        changed = False
+        rest = self.board.masks[cell] & ~allowed
+        while rest:
+            low = rest & -rest
+            rest ^= low
+            changed = self.eliminate(cell, low.bit_length()) or changed
+        return changed
+
+    def _decrement(self, units, b):
+        """Uma célula deixou de admitir o dígito `b` (máscara) nestas unidades."""
+        counts, placed = self.counts, self.placed
+        offset = b.bit_length() - 1
+        for unit in units:
+            index = unit * 9 + offset
+            count = counts[index] - 1
+            counts[index] = count
+            if count > 1 or placed[unit] & b:
+                continue
+            if not count:
+                raise Contradiction(f"{offset + 1} sem lugar na unidade {unit}")
+            masks = self.board.masks
+            for cell in UNITS[unit]:
+                if masks[cell] & b:
+                    self.events.append((HIDDEN_SINGLE, cell, offset + 1))
+                    break
+
+    # Propagação -------------------------------------------------------------
+
+    def propagate(self, listener=None):
+        """
+        Coloca os singles da fila até ela esvaziar; os novos singles que
+        essas colocações criarem entram na mesma fila.
+
+        Args:
+            listener: função opcional chamada com (tipo, célula, dígito) por
+                      cada single colocado
+
+        Returns:
+            O número de células preenchidas
+
+        Raises:
+            Contradiction: se a propagação chegar a um tabuleiro impossível
+        """
+        values, events = self.board.values, self.events
+        filled = 0
+        while events:
+            kind, cell, digit = events.popleft()
+            # Um evento pode já estar cumprido por outra colocação
+            if values[cell] == digit:
+                continue
+            self.place(cell, digit)
+            filled += 1
+            if listener is not None:
+                listener(kind, cell, digit)
+        return filled
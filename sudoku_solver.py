@@ -0,0 +1,103 @@
+"""
+Resolução completa de Sudoku.
+
+Os números dados entram no motor de propagação (sudoku_propagation), que
+coloca os naked e hidden singles; quando não há mais singles, a pesquisa
+escolhe a célula vazia com menos candidatos (MRV), experimenta cada um numa
+cópia do motor e volta atrás quando a propagação chega a uma contradição.
+
+Uso: python sudoku_solver.py [tabuleiro]   (sem argumento, lê o tabuleiro da entrada)
+"""
+import sys
+
+from x_wing_solver import parse_sudoku, print_grid
+from sudoku_board import Board, POPCOUNT, DIGITS_OF
+from sudoku_propagation import Propagator, Contradiction
+
+
+def solve_board(board, max_solutions=2):
+    """
+    Procura até `max_solutions` soluções de um tabuleiro.
+
+    Args:
+        board: Um sudoku_board.Board; os candidatos das células vazias
+               restringem a pesquisa
+        max_solutions: Número de soluções a partir do qual a pesquisa para
+                       (2 chega para saber se a solução é única)
+
+    Returns:
+        Uma lista de Boards resolvidos (vazia se não houver solução)
+    """
+    try:
+        engine = Propagator.from_board(board)
+        engine.propagate()
+    except Contradiction:
+        return []
+    solutions = []
+    _search(engine, max_solutions, solutions)
+    return solutions
+
+
+def _search(engine, max_solutions, solutions):
+    """Pesquisa em profundidade; devolve True quando já há soluções suficientes."""
+    masks = engine.board.masks
+    best, best_count = -1, 10
+    for cell in range(81):
+        mask = masks[cell]
+        if mask and POPCOUNT[mask] < best_count:
+            best, best_count = cell, POPCOUNT[mask]
+            if best_count == 2:
+                break
+    if best < 0:
+        # Sem células vazias: a propagação garante que o tabuleiro é válido
+        solutions.append(engine.board)
+        return len(solutions) >= max_solutions
+    for digit in DIGITS_OF[masks[best]]:
+        branch = engine.copy()
+        try:
+            branch.place(best, digit)
+            branch.propagate()
+        except Contradiction:
+            continue
+        if _search(branch, max_solutions, solutions):
+            return True
+    return False
+
+
+def solve(board_str, max_solutions=2):
+    """
+    Resolve um Sudoku dado em texto (como em `parse_sudoku`).
+
+    Args:
+        board_str: String representando o tabuleiro de Sudoku
+        max_solutions: Número máximo de soluções a procurar
+
+    Returns:
+        Uma lista de matrizes 9x9 resolvidas: vazia se o tabuleiro não tiver
+        solução, com mais de uma se tiver várias
+
+    Raises:
+        ValueError: se o tabuleiro não tiver 81 células
+    """
+    board = Board.from_grid(parse_sudoku(board_str))
+    return [solution.to_grid() for solution in solve_board(board, max_solutions)]
+
+
+def main():
+    board_str = sys.argv[1] if len(sys.argv) > 1 else sys.stdin.read()
+    try:
+        solutions = solve(board_str)
+    except ValueError as erro:
+        print(erro)
+        return 2
+    if not solutions:
+        print("O tabuleiro não tem solução.")
+        return 1
+    if len(solutions) > 1:
+        print("O tabuleiro tem mais do que uma solução; eis uma delas:")
+    print_grid(solutions[0])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+import streamlit as st
+from cache_streamlit import analise_x_wing, solucoes_sudoku
+
+st.title("🧩 Sudoku X-Wing Solver")
+st.markdown("""
+Esta ferramenta ajuda a identificar e aplicar a técnica X-Wing em quebra-cabeças de Sudoku.
+
+**O que é X-Wing?** 
+É uma técnica de resolução onde um número candidato aparece exatamente em duas células em cada uma
+de duas linhas diferentes, e essas células estão nas mesmas colunas. Isto permite eliminar esse número
+de outras células nas mesmas colunas.
+""")
+
+# Interface Streamlit para Sudoku
+st.subheader("Insira seu tabuleiro de Sudoku")
+st.markdown("""
+Insira o tabuleiro no formato de string, usando '.' ou '0' para células vazias.
+Exemplo:
+```
+.....9.7.
+..7...9..
+9..287..3
+.8.154.3.
+...8.3...
+.5.967.8.
+3..571..6
+..5...1..
+.7.3.....
+```
+""")
+
+# Exemplo de Sudoku com X-Wing
+exemplo = """.....9.7.
+..7...9..
+9..287..3
+.8.154.3.
+...8.3...
+.5.967.8.
+3..571..6
+..5...1..
+.7.3....."""
+
+sudoku_input = st.text_area("Tabuleiro de Sudoku:", value=exemplo, height=250)
+
+analisar, resolver = st.columns(2)
+if resolver.button("Resolver"):
+    solucoes = solucoes_sudoku(sudoku_input)
+    if solucoes is None:
+        st.error("Formato de tabuleiro inválido. Certifique-se de que ele tenha 81 caracteres.")
+    elif not solucoes:
+        st.warning("Este tabuleiro não tem solução.")
+    else:
+        if len(solucoes) > 1:
+            st.info("O tabuleiro tem mais do que uma solução; eis uma delas.")
+        st.code("\n".join(
+            " | ".join(" ".join(str(n) for n in linha[k:k + 3]) for k in (0, 3, 6))
+            for linha in solucoes[0]
+        ))
+
+if analisar.button("Analisar X-Wing"):
+    if sudoku_input:
+        # Candidatos e X-Wing calculados uma vez por tabuleiro
+        analise = analise_x_wing(sudoku_input)
+        
+        if analise:
+            grid, eliminations, updated_grid = analise
+            
+            # Exibir tabuleiro original
+            st.subheader("Tabuleiro Original")
+            tabuleiro_html = "<table style='border-collapse: collapse; font-size: 18px; margin: 0 auto;'>"
+            for i in range(9):
+                if i % 3 == 0 and i > 0:
+                    tabuleiro_html += "<tr><td colspan='9'><hr style='border: 2px solid black'></td></tr>"
+                tabuleiro_html += "<tr>"
+                for j in range(9):
+                    if j % 3 == 0 and j > 0:
+                        tabuleiro_html += "<td style='border: none; padding: 0 5px;'>|</td>"
+                    cell = grid[i][j]
+                    if isinstance(cell, int):
+                        tabuleiro_html += f"<td style='width: 30px; height: 30px; text-align: center;'>{cell}</td>"
+                    else:
+                        tabuleiro_html += "<td style='width: 30px; height: 30px; text-align: center;'>.</td>"
+                tabuleiro_html += "</tr>"
+            tabuleiro_html += "</table>"
+            st.markdown(tabuleiro_html, unsafe_allow_html=True)
+            
+            if eliminations:
+                st.success(f"Encontrados {len(eliminations)} candidatos que podem ser eliminados usando X-Wing!")
+                
+                # Mostrar padrões encontrados
+                st.subheader("Padrões X-Wing Encontrados")
+                patterns = {}
+                for row, col, val in eliminations:
+                    if val not in patterns:
+                        patterns[val] = []
+                    patterns[val].append((row, col))
+                
+                for num, positions in patterns.items():
+                    st.markdown(f"**Número {num}** pode ser eliminado das células:")
+                    pos_text = ", ".join([f"({r+1},{c+1})" for r, c in positions])
+                    st.markdown(pos_text)
+                
+                # Candidatos depois de aplicar o X-Wing
+                if updated_grid != grid:
+                    st.subheader("Candidatos Após Aplicar X-Wing")
+                    cand_html = "<table style='border-collapse: collapse; font-size: 12px; margin: 0 auto;'>"
+                    for i in range(9):
+                        if i % 3 == 0 and i > 0:
+                            cand_html += "<tr><td colspan='9'><hr style='border: 2px solid black'></td></tr>"
+                        cand_html += "<tr>"
+                        for j in range(9):
+                            if j % 3 == 0 and j > 0:
+                                cand_html += "<td style='border: none; padding: 0 5px;'>|</td>"
+                            cell = updated_grid[i][j]
+                            if isinstance(cell, int):
+                                cand_html += f"<td style='width: 40px; height: 40px; text-align: center; vertical-align: middle;'>{cell}</td>"
+                            else:
+                                cand_text = "".join([str(n) for n in cell])
+                                cand_html += f"<td style='width: 40px; height: 40px; text-align: center; vertical-align: middle; font-size: 9px;'>{cand_text}</td>"
+                        cand_html += "</tr>"
+                    cand_html += "</table>"
+                    st.markdown(cand_html, unsafe_allow_html=True)
+            else:
+                st.warning("Nenhum padrão X-Wing encontrado neste quebra-cabeça.")
+        else:
+            st.error("Formato de tabuleiro inválido. Certifique-se de que ele tenha 81 caracteres.")
+    else:
+        st.warning("Por favor, insira um tabuleiro de Sudoku.")
+
+# Explicação da técnica X-Wing
+with st.expander("Explicação da Técnica X-Wing"):
+    st.markdown("""
+    ## Como Funciona o X-Wing
+    
+    1. **Conceito Básico**: Um X-Wing ocorre quando um determinado número candidato aparece exatamente em duas células em cada uma de duas linhas diferentes, e essas células estão nas mesmas colunas.
+    
+    2. **Exemplo Visual**:
+       - Imagine que o número 7 aparece como candidato apenas em duas células da linha 2 (nas colunas 3 e 6)
+       - E o número 7 também aparece como candidato apenas em duas células da linha 8 (nas mesmas colunas 3 e 6)
+       - Isso forma um retângulo com os quatro cantos nas posições: (2,3), (2,6), (8,3) e (8,6)
+    
+    3. **A Lógica**:
+       - Em cada uma dessas duas linhas, o número 7 DEVE ir em uma dessas duas posições
+       - Portanto, nas colunas 3 e 6, o número 7 DEVE ocupar as linhas 2 e 8
+       - Isto significa que o número 7 não pode aparecer em NENHUMA outra posição nas colunas 3 e 6
+    
+    4. **X-Wing por Coluna**:
+       - O mesmo padrão pode ocorrer em colunas (em vez de linhas)
+       - Quando um número aparece exatamente em duas células em cada uma de duas colunas
+       - E essas células estão nas mesmas linhas
+       - Você pode eliminar esse número de todas as outras células nessas linhas
+    """)
\ No newline at end of file
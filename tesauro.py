@@ -0,0 +1,196 @@
+import os
+import re
+import sys
+import struct
+from functools import lru_cache
+from vetores import vetor, escrever_vetores, mapear, ler_vetores
+
+# Tesauro no formato MyThes (.dat), como o OpenThesaurus-PT do LibreOffice
+CAMINHO_TESAURO = os.environ.get(
+    "PASSATEMPOS_TESAURO",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados", "th_pt_PT.dat"),
+)
+
+_MAGIA = b"PTTES\x00\x00\x01"
+_CABECALHO = struct.Struct("<8sIII4x")
+
+# Anotações entre parênteses no fim dos sinónimos: "viatura (genérico)"
+_ANOTACAO = re.compile(r"\s*\([^)]*\)\s*$")
+
+
+class Tesauro:
+    """
+    Índice palavra -> sinónimos, compacto e mapeável em memória.
+
+    O vocabulário (entradas e sinónimos) está ordenado e concatenado em
+    `texto`, com a palavra `i` em [inicio_texto[i], inicio_texto[i+1]). Os
+    sinónimos da palavra `i` são os identificadores em
+    `ligacoes[inicio_sinonimos[i]:inicio_sinonimos[i+1]]`.
+    """
+
+    __slots__ = ("_inicio_texto", "_texto", "_inicio_sinonimos", "_ligacoes", "_mmap")
+
+    def __init__(self, inicio_texto, texto, inicio_sinonimos, ligacoes, ficheiro_mapeado=None):
+        self._inicio_texto = inicio_texto
+        self._texto = texto
+        self._inicio_sinonimos = inicio_sinonimos
+        self._ligacoes = ligacoes
+        self._mmap = ficheiro_mapeado
+
+    # Construção -------------------------------------------------------------
+
+    @classmethod
+    def de_sinonimos(cls, sinonimos):
+        """Constrói o tesauro a partir de {palavra: iterável de sinónimos}."""
+        vocabulario = set(sinonimos)
+        for lista in sinonimos.values():
+            vocabulario.update(lista)
+        vocabulario = sorted(vocabulario)
+        ids = {palavra: i for i, palavra in enumerate(vocabulario)}
+
+        inicio_texto, partes = vetor([0]), []
+        inicio_sinonimos, ligacoes = vetor([0]), vetor()
+        for palavra in vocabulario:
+            codificada = palavra.encode("utf-8")
+            partes.append(codificada)
+            inicio_texto.append(inicio_texto[-1] + len(codificada))
+            for sinonimo in dict.fromkeys(sinonimos.get(palavra, ())):
+                if sinonimo != palavra:
+                    ligacoes.append(ids[sinonimo])
+            inicio_sinonimos.append(len(ligacoes))
+        return cls(inicio_texto, b"".join(partes), inicio_sinonimos, ligacoes)
+
+    @classmethod
+    def de_mythes(cls, caminho):
+        """
+        Importa um ficheiro MyThes: 1.ª linha com a codificação, depois
+        blocos "palavra|n" seguidos de n linhas "(classe)|sinónimo|...".
+        """
+        with open(caminho, "rb") as f:
+            codificacao = f.readline().decode("ascii").strip() or "utf-8"
+            linhas = f.read().decode(codificacao, errors="replace").splitlines()
+
+        sinonimos = {}
+        i = 0
+        while i < len(linhas):
+            cabeca = linhas[i].split("|")
+            i += 1
+            if len(cabeca) != 2 or not cabeca[1].strip().isdigit():
+                continue
+            palavra = cabeca[0].strip().lower()
+            lista = sinonimos.setdefault(palavra, [])
+            for linha in linhas[i:i + int(cabeca[1])]:
+                for sinonimo in linha.split("|")[1:]:
+                    sinonimo = _ANOTACAO.sub("", sinonimo).strip().lower()
+                    if sinonimo:
+                        lista.append(sinonimo)
+            i += int(cabeca[1])
+        return cls.de_sinonimos(sinonimos)
+
+    # Forma binária ----------------------------------------------------------
+
+    def guardar(self, caminho):
+        """Grava o tesauro no formato binário lido por `Tesauro.abrir`."""
+        temporario = caminho + ".tmp"
+        with open(temporario, "wb") as f:
+            f.write(_CABECALHO.pack(_MAGIA, len(self), len(self._ligacoes), len(self._texto)))
+            escrever_vetores(f, (self._inicio_texto, self._inicio_sinonimos, self._ligacoes))
+            f.write(self._texto)
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def abrir(cls, caminho):
+        """Abre um tesauro binário mapeando-o em memória (sem copiar os dados)."""
+        dados, vista, (n_palavras, n_ligacoes, n_bytes) = mapear(caminho, _CABECALHO, _MAGIA, "tesauro")
+        try:
+            partes, inicio = ler_vetores(
+                vista, _CABECALHO.size, (n_palavras + 1, n_palavras + 1, n_ligacoes), resto=n_bytes
+            )
+        except ValueError:
+            vista.release()
+            dados.close()
+            raise
+        inicio_texto, inicio_sinonimos, ligacoes = partes
+        texto = vista[inicio:inicio + n_bytes]
+        return cls(inicio_texto, texto, inicio_sinonimos, ligacoes, ficheiro_mapeado=dados)
+
+    # Consultas --------------------------------------------------------------
+
+    def __len__(self):
+        return len(self._inicio_texto) - 1
+
+    def _palavra(self, i):
+        return bytes(self._texto[self._inicio_texto[i]:self._inicio_texto[i + 1]]).decode("utf-8")
+
+    def _procurar(self, palavra):
+        """Identificador da palavra (pesquisa binária no vocabulário), ou -1."""
+        alvo = palavra.encode("utf-8")
+        baixo, alto = 0, len(self)
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            atual = bytes(self._texto[self._inicio_texto[meio]:self._inicio_texto[meio + 1]])
+            if atual < alvo:
+                baixo = meio + 1
+            else:
+                alto = meio
+        if baixo < len(self) and self._palavra(baixo) == palavra:
+            return baixo
+        return -1
+
+    def __contains__(self, palavra):
+        return self._procurar(palavra.lower()) >= 0
+
+    def sinonimos(self, palavra, numero_letras=None):
+        """Sinónimos da palavra (opcionalmente só os com `numero_letras` letras)."""
+        i = self._procurar(palavra.strip().lower())
+        if i < 0:
+            return []
+        lista = [
+            self._palavra(j)
+            for j in self._ligacoes[self._inicio_sinonimos[i]:self._inicio_sinonimos[i + 1]]
+        ]
+        if numero_letras:
+            lista = [s for s in lista if len(s) == numero_letras]
+        return lista
+
+
+@lru_cache(maxsize=None)
+def carregar_tesauro(caminho=CAMINHO_TESAURO):
+    """
+    Carrega o tesauro português.
+
+    Usa a forma binária (`<caminho>.idx`) se existir e estiver atualizada;
+    caso contrário importa o ficheiro MyThes e grava-a. Sem tesauro devolve
+    um índice vazio e os sinónimos vêm só das fontes online.
+    """
+    binario = caminho + ".idx"
+    fonte_existe = os.path.exists(caminho)
+    if os.path.exists(binario) and (
+        not fonte_existe or os.path.getmtime(binario) >= os.path.getmtime(caminho)
+    ):
+        try:
+            return Tesauro.abrir(binario)
+        except ValueError:
+            # Índice antigo ou corrompido: é gerado de novo a partir da fonte
+            pass
+    if not fonte_existe:
+        return Tesauro.de_sinonimos({})
+
+    tesauro = Tesauro.de_mythes(caminho)
+    try:
+        tesauro.guardar(binario)
+    except OSError:
+        pass
+    return tesauro
+
+
+if __name__ == "__main__":
+    # Gera a forma binária: python tesauro.py th_pt_PT.dat [saida.idx]
+    if len(sys.argv) < 2:
+        print("Uso: python tesauro.py <tesauro.dat> [saida.idx]")
+        sys.exit(1)
+    origem = sys.argv[1]
+    destino = sys.argv[2] if len(sys.argv) > 2 else origem + ".idx"
+    tesauro = Tesauro.de_mythes(origem)
+    tesauro.guardar(destino)
+    print(f"{len(tesauro)} palavras gravadas em {destino}")
@@ -0,0 +1,46 @@
+# Os módulos do projeto estão na raiz do repositório, sem pacote; o servidor
+# local dos fornecedores está em benchmarks/
+import os
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.join(RAIZ, "benchmarks"))
+
+import cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_temporaria(tmp_path, monkeypatch):
+    """Cada teste usa uma cache em disco própria e vazia, nunca a de dados/."""
+    nova = cache.CacheDisco(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(cache, "_cache", nova)
+    return nova
+
+
+@pytest.fixture(scope="session")
+def servidor_stub():
+    from stub_fornecedores import ServidorStub
+    servidor = ServidorStub().iniciar()
+    yield servidor
+    servidor.parar()
+
+
+@pytest.fixture
+def stub(servidor_stub, monkeypatch):
+    """Servidor local com os fornecedores apontados para ele, sem latência nem erros."""
+    import fornecedores
+    from stub_fornecedores import FORNECEDORES
+
+    for fornecedor in (fornecedores.DATAMUSE, fornecedores.DICIONARIO, fornecedores.DICIO,
+                       fornecedores.PRIBERAM, fornecedores.WIKTIONARY):
+        caminho, _ = FORNECEDORES[fornecedor.nome]
+        monkeypatch.setattr(fornecedor, "url", servidor_stub.url + caminho)
+        fornecedor.disjuntor.sucesso()
+    servidor_stub.configurar(variacao=0.0)
+    servidor_stub.repor_contagens()
+    yield servidor_stub
+    servidor_stub.configurar(variacao=0.0)
+    servidor_stub.esperar_inativo()
@@ -0,0 +1,106 @@
+"""
+Pesquisa de palavras formadas com letras dadas, comparada com força bruta
+sobre as permutações das letras.
+"""
+import random
+from itertools import permutations
+
+import pytest
+
+from lexico import Lexico, dobrar
+from anagramas import (
+    IndiceAnagramas, procurar_no_lexico, procurar_todos_tamanhos, carregar_indice_anagramas,
+)
+from palavras_wow import palavra_respeita_molde
+
+from test_lexico import PALAVRAS
+
+CONSULTAS = [
+    ("rarroc", 4, None), ("rarroc", 5, "c____"), ("casa", 4, None), ("acoas", 4, None),
+    ("xyz", 3, None), ("casa", 5, None), ("arco", 4, "_r__"), ("rarroc", 5, "_x___"),
+    # Letras e moldes com acentos: a pesquisa é feita sem eles
+    ("caça", 3, None), ("ação", 4, "a__o"), ("maçã", 4, "m___"), ("cãso", 4, None),
+]
+
+
+def por_forca_bruta(palavras, letras, tamanho, molde=None):
+    """Palavras cuja forma sem acentos é uma permutação de `tamanho` letras de `letras`."""
+    chaves = {"".join(p) for p in permutations(dobrar(letras), tamanho)}
+    return sorted(
+        p for p in set(palavras)
+        if dobrar(p) in chaves and (not molde or palavra_respeita_molde(p, molde))
+    )
+
+
+@pytest.fixture(scope="module")
+def lexico():
+    return Lexico.de_palavras(PALAVRAS)
+
+
+@pytest.mark.parametrize("letras, tamanho, molde", CONSULTAS)
+def test_procurar_no_lexico(lexico, letras, tamanho, molde):
+    assert sorted(procurar_no_lexico(letras, tamanho, lexico, molde)) == \
+        por_forca_bruta(PALAVRAS, letras, tamanho, molde)
+
+
+def test_procurar_no_lexico_aleatorio():
+    rng = random.Random(5)
+    palavras = {
+        "".join(rng.choice("aabcçeéor") for _ in range(rng.randrange(2, 7))) for _ in range(400)
+    }
+    lexico = Lexico.de_palavras(palavras)
+    for _ in range(60):
+        letras = "".join(rng.choice("abceor") for _ in range(rng.randrange(3, 7)))
+        tamanho = rng.randrange(2, len(letras) + 1)
+        assert sorted(procurar_no_lexico(letras, tamanho, lexico)) == \
+            por_forca_bruta(palavras, letras, tamanho)
+
+
+def todos_os_tamanhos(palavras, letras, minimo, maximo=None):
+    maximo = len(letras) if maximo is None else maximo
+    return sorted(
+        p for tamanho in range(minimo, maximo + 1) for p in por_forca_bruta(palavras, letras, tamanho)
+    )
+
+
+@pytest.mark.parametrize("letras", ["rarroc", "casa", "acoas", "xyz", "maçãe"])
+def test_procurar_todos_tamanhos(lexico, letras):
+    assert sorted(procurar_todos_tamanhos(letras, lexico)) == todos_os_tamanhos(PALAVRAS, letras, 3)
+    assert sorted(procurar_todos_tamanhos(letras, lexico, minimo=2)) == todos_os_tamanhos(PALAVRAS, letras, 2)
+
+
+@pytest.mark.parametrize("letras", ["rarroc", "casa", "acoas", "xyz", "maçãe"])
+def test_subanagramas(letras):
+    indice = IndiceAnagramas.de_palavras(PALAVRAS)
+    for minimo, maximo in ((1, None), (3, None), (4, 4)):
+        assert sorted(indice.subanagramas(letras, minimo, maximo)) == \
+            todos_os_tamanhos(PALAVRAS, letras, minimo, maximo)
+    assert sorted(indice.anagramas(letras)) == por_forca_bruta(PALAVRAS, letras, len(letras))
+
+
+def test_indice_gravado(tmp_path):
+    texto = tmp_path / "palavras.txt"
+    texto.write_text("\n".join(PALAVRAS), encoding="utf-8")
+    indice = carregar_indice_anagramas(str(texto))
+    ficheiro = tmp_path / "palavras.txt.anagramas"
+    assert ficheiro.exists()
+    reaberto = IndiceAnagramas.abrir(str(ficheiro))
+    assert len(reaberto) == len(indice)
+    for letras in ("rarroc", "acoas"):
+        assert sorted(reaberto.subanagramas(letras, 3)) == todos_os_tamanhos(PALAVRAS, letras, 3)
+
+
+def test_indice_corrompido_volta_a_ser_gerado(tmp_path):
+    texto = tmp_path / "palavras.txt"
+    texto.write_text("\n".join(PALAVRAS), encoding="utf-8")
+    ficheiro = tmp_path / "palavras.txt.anagramas"
+    IndiceAnagramas.de_palavras(PALAVRAS).guardar(str(ficheiro))
+    completo = ficheiro.read_bytes()
+    esperado = todos_os_tamanhos(PALAVRAS, "rarroc", 3)
+    estragado = completo[:-8] + bytes(b ^ 0xFF for b in completo[-8:])
+    for conteudo in [completo[:corte] for corte in range(len(completo))] + [estragado]:
+        ficheiro.write_bytes(conteudo)
+        with pytest.raises(ValueError):
+            IndiceAnagramas.abrir(str(ficheiro))
+        indice = carregar_indice_anagramas.__wrapped__(str(texto))
+        assert sorted(indice.subanagramas("rarroc", 3)) == esperado
@@ -0,0 +1,242 @@
+"""
+Cache em disco das consultas aos fornecedores (cache.py), numa base de
+dados SQLite temporária, e junção de consultas iguais em curso.
+"""
+import time
+import threading
+
+import pytest
+
+import cache
+from cache import CacheDisco, PedidosEmCurso, em_cache
+
+
+@pytest.fixture
+def disco(tmp_path):
+    return CacheDisco(str(tmp_path / "cache.sqlite3"), max_entradas=3)
+
+
+def test_guardar_e_obter(disco):
+    disco.guardar("datamuse", "casa", ["lar", "moradia"], ttl=60)
+    disco.guardar("priberam", "casa", True, ttl=60)
+    assert disco.obter("datamuse", "casa") == ["lar", "moradia"]
+    assert disco.obter("priberam", "casa") is True
+    assert disco.obter("datamuse", "lar", "nada") == "nada"
+
+
+def test_entrada_expirada(disco):
+    disco.guardar("datamuse", "casa", ["lar"], ttl=-1)
+    assert disco.obter("datamuse", "casa", "nada") == "nada"
+
+
+def test_contadores(tmp_path, disco):
+    disco.guardar("datamuse", "casa", ["lar"], ttl=60)
+    disco.obter("datamuse", "casa")
+    disco.obter("datamuse", "casa")
+    disco.obter("datamuse", "lar")
+    disco.obter("priberam", "casa")
+    assert disco.estatisticas() == {"datamuse": (2, 1), "priberam": (0, 1)}
+    # Os contadores ficaram gravados na base de dados
+    assert CacheDisco(disco.caminho).estatisticas() == {"datamuse": (2, 1), "priberam": (0, 1)}
+
+
+def test_acerto_nao_escreve(disco):
+    disco.guardar("datamuse", "casa", ["lar"], ttl=60)
+    ligacao = disco._ligacao()
+    alteracoes = ligacao.total_changes
+    for _ in range(50):
+        disco.obter("datamuse", "casa")
+    assert ligacao.total_changes == alteracoes
+
+
+def test_podar_remove_expiradas_e_menos_usadas(disco, monkeypatch):
+    monkeypatch.setattr(cache, "_RESOLUCAO_ACESSO", 0)
+    disco.guardar("datamuse", "velha", 1, ttl=-1)
+    for palavra in ("a", "b", "c", "d"):
+        disco.guardar("datamuse", palavra, 1, ttl=60)
+        time.sleep(0.01)
+    # Um acerto em "a" torna-a a mais recente
+    assert disco.obter("datamuse", "a") == 1
+    disco.podar()
+    restantes = {p for p in ("velha", "a", "b", "c", "d") if disco.obter("datamuse", p) is not None}
+    assert restantes == {"a", "c", "d"}
+
+
+def test_limpar(disco):
+    disco.guardar("datamuse", "casa", ["lar"], ttl=60)
+    disco.obter("datamuse", "casa")
+    disco.limpar()
+    assert disco.obter("datamuse", "casa") is None
+    assert disco.estatisticas() == {"datamuse": (0, 1)}
+
+
+def test_em_cache_prazos_positivo_e_negativo():
+    chamadas = []
+
+    @em_cache("teste", ttl=60, ttl_negativo=-1)
+    def consultar(palavra):
+        chamadas.append(palavra)
+        return palavra == "casa"
+
+    assert consultar("casa") is True
+    assert consultar("casa") is True
+    # A resposta negativa expira logo (prazo negativo)
+    assert consultar("xyz") is False
+    assert consultar("xyz") is False
+    assert chamadas == ["casa", "xyz", "xyz"]
+    assert consultar.guardado("casa") == (True, True)
+    assert consultar.guardado("lar") == (False, None)
+
+
+def test_em_cache_erros_nao_ficam_guardados():
+    respostas = [RuntimeError("503"), True]
+
+    @em_cache("teste", em_erro=False)
+    def consultar(palavra):
+        resposta = respostas.pop(0)
+        if isinstance(resposta, Exception):
+            raise resposta
+        return resposta
+
+    assert consultar("casa") is False
+    assert consultar.guardado("casa") == (False, None)
+    assert consultar("casa") is True
+    assert consultar("casa") is True
+    assert respostas == []
+
+
+def test_em_cache_sem_em_erro_propaga():
+    @em_cache("teste")
+    def consultar(palavra):
+        raise RuntimeError("timeout")
+
+    with pytest.raises(RuntimeError):
+        consultar("casa")
+    assert consultar.guardado("casa") == (False, None)
+
+
+def test_acessos_concorrentes(tmp_path):
+    disco = CacheDisco(str(tmp_path / "concorrente.sqlite3"))
+    erros = []
+
+    def trabalhar(i):
+        try:
+            for j in range(50):
+                disco.guardar("teste", f"{i}-{j}", j, ttl=60)
+                assert disco.obter("teste", f"{i}-{j}") == j
+        except Exception as e:
+            erros.append(e)
+
+    fios = [threading.Thread(target=trabalhar, args=(i,)) for i in range(8)]
+    for fio in fios:
+        fio.start()
+    for fio in fios:
+        fio.join()
+    assert erros == []
+    assert disco.estatisticas()["teste"] == (400, 0)
+
+
+def em_simultaneo(funcao, n):
+    """Chama `funcao()` em `n` threads; devolve os resultados ou exceções de cada uma."""
+    resultados = [None] * n
+
+    def correr(i):
+        try:
+            resultados[i] = funcao()
+        except Exception as e:
+            resultados[i] = e
+
+    fios = [threading.Thread(target=correr, args=(i,)) for i in range(n)]
+    for fio in fios:
+        fio.start()
+    for fio in fios:
+        fio.join()
+    return resultados
+
+
+def test_pedidos_iguais_partilham_uma_consulta():
+    pedidos = PedidosEmCurso()
+    chamadas = []
+
+    def consultar(palavra):
+        chamadas.append(palavra)
+        time.sleep(0.2)
+        return [palavra, "lar"]
+
+    resultados = em_simultaneo(lambda: pedidos.executar(("datamuse", "casa"), consultar, "casa"), 8)
+    assert chamadas == ["casa"]
+    assert resultados == [["casa", "lar"]] * 8
+    # Todos recebem o mesmo objeto
+    assert all(r is resultados[0] for r in resultados)
+    assert pedidos.partilhados == {"datamuse": 7}
+    # Terminada a consulta, a chave deixa de estar em curso
+    pedidos.executar(("datamuse", "casa"), consultar, "casa")
+    assert chamadas == ["casa", "casa"]
+
+
+def test_pedidos_iguais_partilham_a_excecao():
+    pedidos = PedidosEmCurso()
+    chamadas = []
+
+    def consultar():
+        chamadas.append(1)
+        time.sleep(0.2)
+        raise RuntimeError("503")
+
+    resultados = em_simultaneo(lambda: pedidos.executar(("priberam", "casa"), consultar), 6)
+    assert len(chamadas) == 1
+    assert all(isinstance(r, RuntimeError) for r in resultados)
+    assert all(r is resultados[0] for r in resultados)
+
+
+def test_chaves_diferentes_nao_se_juntam():
+    pedidos = PedidosEmCurso()
+    chamadas = []
+
+    def consultar(palavra):
+        chamadas.append(palavra)
+        time.sleep(0.1)
+        return palavra
+
+    palavras = ["casa", "lar", "mar", "sol"]
+    contador = iter(range(len(palavras)))
+    trinco = threading.Lock()
+
+    def proxima():
+        with trinco:
+            palavra = palavras[next(contador)]
+        return pedidos.executar(("datamuse", palavra), consultar, palavra)
+
+    assert sorted(em_simultaneo(proxima, 4)) == sorted(palavras)
+    assert sorted(chamadas) == sorted(palavras)
+    assert not pedidos.partilhados
+
+
+def test_em_cache_junta_chamadas_e_guarda_uma_vez():
+    chamadas = []
+
+    @em_cache("teste_junta", em_erro=False)
+    def consultar(palavra):
+        chamadas.append(palavra)
+        time.sleep(0.2)
+        return True
+
+    assert em_simultaneo(lambda: consultar("casa"), 8) == [True] * 8
+    assert chamadas == ["casa"]
+    assert cache.pedidos_partilhados()["teste_junta"] == 7
+    assert consultar("casa") is True
+    assert chamadas == ["casa"]
+
+
+def test_em_cache_erro_partilhado_nao_fica_guardado():
+    chamadas = []
+
+    @em_cache("teste_erro", em_erro=False)
+    def consultar(palavra):
+        chamadas.append(palavra)
+        time.sleep(0.2)
+        raise RuntimeError("timeout")
+
+    assert em_simultaneo(lambda: consultar("casa"), 5) == [False] * 5
+    assert chamadas == ["casa"]
+    assert consultar.guardado("casa") == (False, None)
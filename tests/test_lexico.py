@@ -0,0 +1,92 @@
+"""
+Léxico em trie: pertença, prefixos, formas acentuadas, enumeração e forma
+binária.
+"""
+import pytest
+
+from lexico import Lexico, carregar_lexico, dobrar
+
+PALAVRAS = [
+    "casa", "caça", "saca", "asa", "as", "cas", "caos", "cão", "coas", "soca",
+    "maçã", "maca", "maça", "mãe", "ação", "cacao", "cacau", "arroz", "carro",
+    "rocar", "corra", "orar", "arar", "rara", "ocar", "coar", "acor", "arco",
+]
+
+
+@pytest.fixture(scope="module")
+def lexico():
+    return Lexico.de_palavras(PALAVRAS)
+
+
+def test_pertenca_e_prefixos(lexico):
+    assert "casa" in lexico and "arco" in lexico
+    assert "cas" in lexico and "ca" not in lexico
+    assert "carros" not in lexico
+    assert lexico.tem_prefixo("arr") and not lexico.tem_prefixo("zz")
+    assert sorted(lexico.palavras("ar")) == ["arar", "arco", "arroz"]
+    assert sorted(lexico.palavras()) == sorted(set(PALAVRAS))
+    assert len(lexico) == len(set(PALAVRAS))
+
+
+def test_dobrar():
+    assert dobrar("ação") == "acao"
+    assert dobrar("maçã") == "maca"
+    assert dobrar("Árvore") == "Arvore"
+    assert dobrar("casa") == "casa"
+
+
+def test_formas_acentuadas(lexico):
+    assert sorted(lexico.formas("maca")) == ["maca", "maça", "maçã"]
+    assert lexico.formas("MAÇA") == []
+    assert lexico.formas("acao") == ["ação"]
+    assert lexico.formas("mae") == ["mãe"]
+    assert "caça" in lexico and "maçã" in lexico
+    # A pertença respeita os acentos; a pesquisa por chave ignora-os
+    assert "cáça" not in lexico and "macã" not in lexico and "acao" not in lexico
+    assert lexico.tem_prefixo("açã")
+
+
+def test_palavras_repetidas_contam_uma_vez():
+    assert len(Lexico.de_palavras(["casa", "casa", "asa"])) == 2
+    assert len(Lexico.de_palavras(["maca", "maçã", "maçã", "maça"])) == 3
+
+
+def test_lexico_vazio():
+    lexico = Lexico.de_palavras([])
+    assert len(lexico) == 0
+    assert "casa" not in lexico
+    assert list(lexico.palavras()) == []
+
+
+def test_forma_binaria(tmp_path):
+    texto = tmp_path / "palavras.txt"
+    # Linhas com números ou pontuação são ignoradas
+    texto.write_text("\n".join(PALAVRAS + ["1984", "fim-de-semana", ""]), encoding="utf-8")
+    lexico = carregar_lexico(str(texto))
+    binario = tmp_path / "palavras.txt.bin"
+    assert binario.exists()
+    reaberto = Lexico.abrir(str(binario))
+    assert len(reaberto) == len(lexico) == len(set(PALAVRAS))
+    assert sorted(reaberto.palavras()) == sorted(lexico.palavras()) == sorted(set(PALAVRAS))
+    assert "arroz" in reaberto and "1984" not in reaberto
+    assert sorted(reaberto.formas("maca")) == ["maca", "maça", "maçã"]
+
+
+def test_sem_lista_de_palavras(tmp_path):
+    assert len(carregar_lexico(str(tmp_path / "nao_existe.txt"))) == 0
+
+
+def test_binario_truncado_volta_a_ser_gerado(tmp_path):
+    texto = tmp_path / "palavras.txt"
+    texto.write_text("\n".join(PALAVRAS), encoding="utf-8")
+    binario = tmp_path / "palavras.txt.bin"
+    Lexico.de_palavras(PALAVRAS).guardar(str(binario))
+    completo = binario.read_bytes()
+    # Cortes no cabeçalho, nos vetores, nas marcas dos nós e na tabela de formas acentuadas
+    for corte in range(len(completo)):
+        binario.write_bytes(completo[:corte])
+        with pytest.raises(ValueError):
+            Lexico.abrir(str(binario))
+        lexico = carregar_lexico.__wrapped__(str(texto))
+        assert len(lexico) == len(set(PALAVRAS)), corte
+        assert lexico.formas("caca") == ["caça"], corte
@@ -0,0 +1,231 @@
+"""
+Solucionador de Sudoku, motor de propagação e equivalência das funções de
+x_wing_solver (matrizes de listas) com a versão em máscaras de bits.
+"""
+import copy
+import random
+
+import pytest
+
+from sudoku_board import Board, UNITS, DIGITS_OF, bit
+from sudoku_propagation import Propagator, Contradiction
+from sudoku_solver import solve
+from x_wing_solver import parse_sudoku, fill_candidates, find_x_wings, apply_x_wing
+
+HARD_PUZZLES = {
+    "17 dados": "000000010400000000020000000000050407008000300001090000300400200050100000000806000",
+    "AI Escargot": "1....7.9..3..2...8..96..5....53..9...1..8...26....4...3......1..4......7..7...3..",
+    "Inkala 2012": "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+}
+
+
+def givens(board_str):
+    return [int(c) for c in board_str.replace(".", "0")]
+
+
+def assert_valid_solution(grid, board_str):
+    cells = [grid[i // 9][i % 9] for i in range(81)]
+    for unit in UNITS:
+        assert sorted(cells[i] for i in unit) == list(range(1, 10))
+    for cell, value in enumerate(givens(board_str)):
+        if value:
+            assert cells[cell] == value
+
+
+# Referência: as funções de x_wing_solver antes de passarem a usar Board ----
+
+def reference_find_x_wings(grid):
+    def has(r, c, num):
+        return isinstance(grid[r][c], list) and num in grid[r][c]
+
+    eliminations = []
+    for num in range(1, 10):
+        for line1 in range(9):
+            cols = [c for c in range(9) if has(line1, c, num)]
+            if len(cols) == 2:
+                for line2 in range(line1 + 1, 9):
+                    if [c for c in range(9) if has(line2, c, num)] == cols:
+                        for row in range(9):
+                            if row != line1 and row != line2:
+                                for col in cols:
+                                    if has(row, col, num):
+                                        eliminations.append((row, col, num))
+    for num in range(1, 10):
+        for col1 in range(9):
+            rows = [r for r in range(9) if has(r, col1, num)]
+            if len(rows) == 2:
+                for col2 in range(col1 + 1, 9):
+                    if [r for r in range(9) if has(r, col2, num)] == rows:
+                        for col in range(9):
+                            if col != col1 and col != col2:
+                                for row in rows:
+                                    if has(row, col, num):
+                                        eliminations.append((row, col, num))
+    return eliminations
+
+
+def reference_fill_candidates(grid):
+    for row in range(9):
+        for col in range(9):
+            if isinstance(grid[row][col], list):
+                used = {grid[row][c] for c in range(9) if isinstance(grid[row][c], int)}
+                used |= {grid[r][col] for r in range(9) if isinstance(grid[r][col], int)}
+                br, bc = 3 * (row // 3), 3 * (col // 3)
+                used |= {
+                    grid[r][c] for r in range(br, br + 3) for c in range(bc, bc + 3)
+                    if isinstance(grid[r][c], int)
+                }
+                grid[row][col] = [n for n in range(1, 10) if n not in used]
+    return grid
+
+
+def random_candidate_grids(count, seed=2012):
+    """Grelhas de candidatos tiradas de soluções reais, com candidatos cortados para criar X-Wings."""
+    rng = random.Random(seed)
+    solutions = [solve(puzzle, 1)[0] for puzzle in HARD_PUZZLES.values()]
+    for _ in range(count):
+        solution = rng.choice(solutions)
+        grid = [
+            [value if rng.random() < 0.35 else list(range(1, 10)) for value in row]
+            for row in solution
+        ]
+        reference_fill_candidates(grid)
+        for row in range(9):
+            for col in range(9):
+                cell = grid[row][col]
+                if isinstance(cell, list) and len(cell) > 1:
+                    # Mantém sempre o dígito da solução
+                    grid[row][col] = [
+                        d for d in cell if d == solution[row][col] or rng.random() < 0.6
+                    ]
+        yield grid
+
+
+# Solucionador ---------------------------------------------------------------
+
+@pytest.mark.parametrize("name", HARD_PUZZLES)
+def test_solve_hard_puzzles_unique(name):
+    solutions = solve(HARD_PUZZLES[name])
+    assert len(solutions) == 1
+    assert_valid_solution(solutions[0], HARD_PUZZLES[name])
+
+
+def test_solve_no_solution():
+    assert solve("11" + "0" * 79) == []
+    # Sem conflito direto, mas o 1 não cabe em nenhuma célula da primeira linha
+    rows = ["000000230", "100000000", "000100000", "000000001"] + ["0" * 9] * 5
+    assert solve("".join(rows)) == []
+
+
+def test_solve_multiple_solutions():
+    solutions = solve("0" * 81)
+    assert len(solutions) == 2
+    assert solutions[0] != solutions[1]
+    for solution in solutions:
+        assert_valid_solution(solution, "0" * 81)
+    assert len(solve("0" * 81, max_solutions=5)) == 5
+
+
+def test_solve_rejects_bad_size():
+    with pytest.raises(ValueError):
+        solve("123")
+
+
+# Motor de propagação ----------------------------------------------------------
+
+def assert_counts_match_recount(engine):
+    """Os contadores incrementais têm de coincidir com uma contagem feita do zero."""
+    values, masks = engine.board.values, engine.board.masks
+    for unit, cells in enumerate(UNITS):
+        placed = 0
+        for cell in cells:
+            if values[cell]:
+                placed |= bit(values[cell])
+        assert engine.placed[unit] == placed
+        for digit in range(1, 10):
+            expected = sum(1 for cell in cells if masks[cell] & bit(digit))
+            assert engine.counts[unit * 9 + digit - 1] == expected, (unit, digit)
+
+
+@pytest.mark.parametrize("name", HARD_PUZZLES)
+def test_propagation_counts_after_givens(name):
+    engine = Propagator.parse(HARD_PUZZLES[name])
+    assert_counts_match_recount(engine)
+    engine.propagate()
+    assert_counts_match_recount(engine)
+    # A propagação só coloca números compatíveis com a solução
+    solution = solve(HARD_PUZZLES[name])[0]
+    for cell, value in enumerate(engine.board.values):
+        if value:
+            assert value == solution[cell // 9][cell % 9]
+
+
+def test_propagation_counts_random_play():
+    rng = random.Random(7)
+    for _ in range(30):
+        engine = Propagator()
+        try:
+            for _ in range(rng.randrange(5, 40)):
+                cell = rng.randrange(81)
+                if engine.board.values[cell]:
+                    continue
+                digit = rng.choice(DIGITS_OF[engine.board.masks[cell]])
+                if rng.random() < 0.5:
+                    engine.place(cell, digit)
+                else:
+                    engine.eliminate(cell, digit)
+                engine.propagate()
+                assert_counts_match_recount(engine)
+        except Contradiction:
+            continue
+
+
+def test_propagation_copy_is_independent():
+    engine = Propagator.parse(HARD_PUZZLES["AI Escargot"])
+    branch = engine.copy()
+    cell = next(i for i in range(81) if not branch.board.values[i])
+    branch.place(cell, branch.board.candidates(cell)[0])
+    assert not engine.board.values[cell]
+    assert_counts_match_recount(engine)
+    assert_counts_match_recount(branch)
+
+
+def test_propagator_candidates_match_fill_candidates():
+    """Colocados os números dados, os candidatos do motor são os de fill_candidates."""
+    for puzzle in HARD_PUZZLES.values():
+        engine = Propagator.parse(puzzle)
+        filled = Board(engine.board.values).fill_candidates()
+        assert engine.board.masks == filled.masks
+
+
+# Equivalência com as funções de listas ----------------------------------------
+
+def test_fill_candidates_matches_reference():
+    for puzzle in HARD_PUZZLES.values():
+        grid = parse_sudoku(puzzle)
+        assert fill_candidates(copy.deepcopy(grid)) == reference_fill_candidates(copy.deepcopy(grid))
+
+
+def test_find_x_wings_matches_reference():
+    found = 0
+    for grid in random_candidate_grids(300):
+        expected = reference_find_x_wings(grid)
+        # Mesmas eliminações e pela mesma ordem
+        assert find_x_wings(grid) == expected
+        found += bool(expected)
+    assert found > 20
+
+
+def test_apply_x_wing_matches_reference():
+    for grid in random_candidate_grids(100, seed=99):
+        expected = copy.deepcopy(grid)
+        eliminations = reference_find_x_wings(expected)
+        for row, col, val in eliminations:
+            # Dois X-Wings podem eliminar o mesmo candidato (a versão de
+            # listas falhava no segundo `remove`)
+            if val in expected[row][col]:
+                expected[row][col].remove(val)
+        applied, updated = apply_x_wing(grid)
+        assert applied == bool(eliminations)
+        assert updated is grid
+        assert updated == expected
@@ -0,0 +1,54 @@
+"""
+Tesauro em formato MyThes e a sua forma binária.
+"""
+import pytest
+
+from tesauro import Tesauro, carregar_tesauro
+
+MYTHES = """UTF-8
+casa|2
+(Subst.)|lar|moradia|residência
+(Subst.)|família
+lar|1
+(Subst.)|casa|moradia
+moradia|1
+(Subst.)|casa|residência (formal)
+"""
+
+
+@pytest.fixture
+def fonte(tmp_path):
+    caminho = tmp_path / "th_pt_PT.dat"
+    caminho.write_text(MYTHES, encoding="utf-8")
+    return caminho
+
+
+def test_forma_binaria(fonte):
+    tesauro = carregar_tesauro.__wrapped__(str(fonte))
+    reaberto = Tesauro.abrir(str(fonte) + ".idx")
+    assert len(reaberto) == len(tesauro)
+    for palavra in ("casa", "lar", "moradia", "inexistente"):
+        assert reaberto.sinonimos(palavra) == tesauro.sinonimos(palavra)
+    assert "lar" in reaberto.sinonimos("casa")
+    assert reaberto.sinonimos("casa", 3) == ["lar"]
+
+
+def test_indice_truncado_volta_a_ser_gerado(fonte):
+    binario = str(fonte) + ".idx"
+    esperado = carregar_tesauro.__wrapped__(str(fonte)).sinonimos("casa")
+    with open(binario, "rb") as f:
+        completo = f.read()
+    for corte in range(len(completo)):
+        with open(binario, "wb") as f:
+            f.write(completo[:corte])
+        with pytest.raises(ValueError):
+            Tesauro.abrir(binario)
+        assert carregar_tesauro.__wrapped__(str(fonte)).sinonimos("casa") == esperado, corte
+
+
+def test_indice_corrompido_sem_fonte(fonte):
+    binario = str(fonte) + ".idx"
+    with open(binario, "wb") as f:
+        f.write(b"lixo")
+    fonte.unlink()
+    assert len(carregar_tesauro.__wrapped__(str(fonte))) == 0
@@ -0,0 +1,139 @@
+"""
+Validação concorrente das palavras do WOW contra o servidor local dos
+fornecedores (benchmarks/stub_fornecedores.py).
+"""
+import time
+import threading
+
+from lexico import Lexico
+from palavras_wow import gerar_candidatos
+from validacao import (
+    ValidadorConcorrente, validar_datamuse, validar_priberam, validar_wiktionary,
+    validar_wiktionary_em_lote,
+)
+
+# Hosts distintos para os limites por host: no servidor local todos os
+# fornecedores partilham o mesmo endereço
+FONTES = [
+    (validar_datamuse, "http://datamuse.teste/"),
+    (validar_priberam, "http://priberam.teste/"),
+    (validar_wiktionary, "http://wiktionary.teste/"),
+]
+
+
+def validador(limite_por_host=4, fontes=FONTES, palavras=()):
+    return ValidadorConcorrente(fontes, limite_por_host, lexico=Lexico.de_palavras(palavras))
+
+
+def no_vocabulario(stub, candidatos):
+    return sorted(set(candidatos) & stub.vocabulario)
+
+
+def test_validar_wiktionary_em_lote(stub):
+    candidatos = gerar_candidatos("rarroca", 4)
+    resultados = dict(validar_wiktionary_em_lote(candidatos))
+    assert sorted(p for p, valida in resultados.items() if valida) == no_vocabulario(stub, candidatos)
+    assert set(resultados) == set(candidatos)
+    pedidos = stub.repor_contagens()["wiktionary"]
+    assert pedidos == -(-len(set(candidatos)) // 50)
+    # Os resultados ficaram na cache de validar_wiktionary
+    assert validar_wiktionary.guardado("arco") == (True, True)
+    assert validar_wiktionary.guardado("rroc") == (True, False)
+    assert dict(validar_wiktionary_em_lote(candidatos)) == resultados
+    assert "wiktionary" not in stub.repor_contagens()
+
+
+def test_fontes_rapidas_nao_esperam_pelos_lotes(stub):
+    stub.configurar(["datamuse", "priberam"], latencia=0.05, variacao=0.0)
+    stub.configurar(["wiktionary"], latencia=1.0, variacao=0.0)
+    candidatos = gerar_candidatos("rarroca", 4)
+    inicio = time.monotonic()
+    chegadas = []
+    for palavra in validador().validar_em_fluxo(candidatos):
+        chegadas.append((time.monotonic() - inicio, palavra))
+    assert chegadas[0][0] < 0.6, chegadas[:3]
+    assert sorted(p for _, p in chegadas) == no_vocabulario(stub, candidatos)
+
+
+def test_lote_falhado_passa_a_pedidos_por_palavra(stub, monkeypatch):
+    import validacao
+    monkeypatch.setattr(validacao, "_consultar_lote_wiktionary", lambda lote: None)
+    candidatos = ["arco", "rroc", "orca"]
+    assert sorted(validador(fontes=[FONTES[2]]).validar(candidatos)) == ["arco", "orca"]
+    assert stub.repor_contagens()["wiktionary"] == 3
+
+
+def test_formas_do_lexico_sem_repeticoes():
+    # Sem fontes online: só o léxico responde
+    lexico_validador = validador(fontes=[], palavras=["acao", "ação", "caos", "cão"])
+    assert sorted(lexico_validador.validar(gerar_candidatos("ação", 4))) == ["acao", "ação"]
+    assert sorted(lexico_validador.validar(gerar_candidatos("cãos", 4))) == ["caos"]
+    assert sorted(lexico_validador.validar(gerar_candidatos("cãos", 3))) == ["cão"]
+
+
+class Concorrencia:
+    """Conta quantas consultas das fontes envolvidas estão a correr ao mesmo tempo."""
+
+    def __init__(self):
+        self.atual = 0
+        self.pico = 0
+        self._trinco = threading.Lock()
+
+    def envolver(self, fonte):
+        def envolvida(palavra):
+            with self._trinco:
+                self.atual += 1
+                self.pico = max(self.pico, self.atual)
+            try:
+                return fonte(palavra)
+            finally:
+                with self._trinco:
+                    self.atual -= 1
+        return envolvida
+
+
+def test_primeira_resposta_positiva_dispensa_as_outras(stub):
+    stub.configurar(["datamuse"], latencia=0.05, variacao=0.0)
+    stub.configurar(["priberam"], latencia=0.5, variacao=0.0)
+    palavras = ["arco", "cara", "caro", "corar", "orca", "roca", "carro", "corro"]
+    inicio = time.monotonic()
+    confirmadas = validador(limite_por_host=1, fontes=FONTES[:2]).validar(palavras)
+    assert sorted(confirmadas) == sorted(palavras)
+    # Sem a corrida seriam 8 pedidos de 0,5 s ao Priberam, um de cada vez
+    assert time.monotonic() - inicio < 1.5
+    assert stub.repor_contagens().get("priberam", 0) <= 2
+
+
+def test_limite_de_pedidos_por_host(stub):
+    stub.configurar(latencia=0.1, variacao=0.0)
+    mesmo_host = Concorrencia()
+    fontes = [
+        (mesmo_host.envolver(validar_datamuse), "http://partilhado.teste/"),
+        (mesmo_host.envolver(validar_priberam), "http://partilhado.teste/"),
+    ]
+    # Palavras que não existem: nenhuma fonte as confirma e correm todas as consultas
+    palavras = [f"zz{letra}" for letra in "abcdefghij"]
+    assert validador(limite_por_host=3, fontes=fontes).validar(palavras) == []
+    assert mesmo_host.pico == 3
+    assert stub.repor_contagens() == {"datamuse": 10, "priberam": 10}
+
+
+def test_hosts_diferentes_correm_em_paralelo(stub):
+    stub.configurar(latencia=0.1, variacao=0.0)
+    total, datamuse, priberam = Concorrencia(), Concorrencia(), Concorrencia()
+    fontes = [
+        (total.envolver(datamuse.envolver(validar_datamuse)), FONTES[0][1]),
+        (total.envolver(priberam.envolver(validar_priberam)), FONTES[1][1]),
+    ]
+    palavras = [f"zz{letra}" for letra in "abcdefghij"]
+    assert validador(limite_por_host=2, fontes=fontes).validar(palavras) == []
+    assert datamuse.pico == priberam.pico == 2
+    assert total.pico == 4
+
+
+def test_fonte_com_erros_nao_impede_as_outras(stub):
+    stub.configurar(["priberam"], erros=1.0)
+    palavras = ["arco", "zzz", "orca"]
+    assert sorted(validador(fontes=FONTES[:2]).validar(palavras)) == ["arco", "orca"]
+    stub.configurar(erros=1.0)
+    assert validador(fontes=FONTES[:2]).validar(["cara", "zzz"]) == []
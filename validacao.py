@@ -0,0 +1,268 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from urllib.parse import urlparse
+from cache import em_cache
+from fornecedores import DATAMUSE, PRIBERAM, WIKTIONARY
+from lexico import carregar_lexico, dobrar
+from anagramas import formavel
+
+
+@em_cache("datamuse_sp", em_erro=False)
+def validar_datamuse(palavra):
+    """Valida palavra usando Datamuse API."""
+    params = {"sp": palavra, "max": 1}
+    resultados = DATAMUSE.obter(params=params).confirmar().json()
+    return any(item["word"].lower() == palavra.lower() for item in resultados)
+
+
+@em_cache("priberam", em_erro=False)
+def validar_priberam(palavra):
+    """Valida palavra usando Priberam (dicionário de português) via scraping."""
+    resultado = PRIBERAM.obter(palavra).confirmar(404)
+    # Palavra válida se existe a secção de aceitação do Priberam
+    return "não foi encontrada" not in resultado.texto.lower()
+
+
+@em_cache("wiktionary", em_erro=False)
+def validar_wiktionary(palavra):
+    """Valida palavra usando Wiktionary API."""
+    params = {
+        "action": "query",
+        "titles": palavra,
+        "format": "json"
+    }
+    data = WIKTIONARY.obter(params=params).confirmar().json()
+    pages = data.get("query", {}).get("pages", {})
+    return not "-1" in pages
+
+
+# Máximo de títulos por pedido aceite pela API do MediaWiki (sem direitos de bot)
+TAMANHO_LOTE_WIKTIONARY = 50
+
+
+def _consultar_lote_wiktionary(palavras):
+    """Conjunto das palavras do lote com página no Wiktionary (None em caso de erro)."""
+    params = {
+        "action": "query",
+        "titles": "|".join(palavras),
+        "format": "json"
+    }
+    try:
+        query = WIKTIONARY.obter(params=params).confirmar().json().get("query", {})
+    except Exception:
+        return None
+    # O MediaWiki pode normalizar os títulos; volta-se à forma pedida
+    originais = {n["to"]: n["from"] for n in query.get("normalized", [])}
+    return {
+        originais.get(pagina["title"], pagina["title"])
+        for pagina in query.get("pages", {}).values()
+        if "missing" not in pagina and "invalid" not in pagina
+    }
+
+
+def _lotes_wiktionary(palavras):
+    """
+    Separa as palavras já em cache das que têm de ser pedidas: devolve
+    ({palavra: válida} guardado, lotes de até `TAMANHO_LOTE_WIKTIONARY` palavras).
+    """
+    guardados = {}
+    por_consultar = []
+    for palavra in dict.fromkeys(palavras):
+        encontrado, valida = validar_wiktionary.guardado(palavra)
+        if encontrado:
+            guardados[palavra] = valida
+        else:
+            por_consultar.append(palavra)
+    lotes = [
+        por_consultar[i:i + TAMANHO_LOTE_WIKTIONARY]
+        for i in range(0, len(por_consultar), TAMANHO_LOTE_WIKTIONARY)
+    ]
+    return guardados, lotes
+
+
+def _validar_lote_wiktionary(lote):
+    """Consulta um lote e guarda cada resultado na cache de `validar_wiktionary`; None se o pedido falhar."""
+    existentes = _consultar_lote_wiktionary(lote)
+    if existentes is None:
+        return None
+    resultados = {}
+    for palavra in lote:
+        valida = palavra in existentes
+        validar_wiktionary.guardar(valida, palavra)
+        resultados[palavra] = valida
+    return resultados
+
+
+def validar_wiktionary_em_lote(palavras, paralelos=4):
+    """
+    Valida muitas palavras no Wiktionary com pedidos de vários títulos.
+
+    As palavras já em cache não são pedidas; as restantes seguem em lotes de
+    `TAMANHO_LOTE_WIKTIONARY`, `paralelos` de cada vez, e cada resultado fica
+    guardado na cache de `validar_wiktionary`. Gera pares (palavra, válida)
+    à medida que cada lote responde; palavras de lotes que falharam ficam de fora.
+    """
+    guardados, lotes = _lotes_wiktionary(palavras)
+    yield from guardados.items()
+    if not lotes:
+        return
+    with ThreadPoolExecutor(max_workers=paralelos) as executor:
+        for futuro in as_completed([executor.submit(_validar_lote_wiktionary, lote) for lote in lotes]):
+            yield from (futuro.result() or {}).items()
+
+
+@em_cache("datamuse_padrao", em_erro=[])
+def consultar_padrao_datamuse(padrao, maximo=1000):
+    """Vocabulário da Datamuse que encaixa num padrão com '?' (ex.: `c??r?`)."""
+    params = {"sp": padrao, "max": maximo}
+    resultado = DATAMUSE.obter(params=params).confirmar()
+    return [item["word"].lower() for item in resultado.json()]
+
+
+def validar_por_padrao(letras, tamanho, molde=None):
+    """
+    Valida em lote com um único pedido à Datamuse: o molde passa a padrão
+    com '?' e as palavras devolvidas são filtradas pelas letras disponíveis.
+    """
+    letras = letras.lower()
+    molde = dobrar(molde.lower()) if molde else "_" * tamanho
+    padrao = "".join("?" if m == "_" else m for m in molde[:tamanho])
+    return [
+        palavra for palavra in dict.fromkeys(consultar_padrao_datamuse(padrao))
+        if len(palavra) == tamanho and palavra.isalpha() and formavel(palavra, letras)
+    ]
+
+
+def _host(url):
+    return urlparse(url).netloc
+
+
+class ValidadorConcorrente:
+    """
+    Valida um conjunto de palavras em paralelo.
+
+    Para cada palavra as três fontes correm em corrida: a primeira resposta
+    positiva confirma a palavra e as consultas dessa palavra que ainda não
+    começaram são canceladas. O número de pedidos simultâneos a cada host
+    fica limitado a `limite_por_host`.
+    """
+
+    def __init__(self, fontes=None, limite_por_host=4, lexico=None):
+        if fontes is None:
+            fontes = [
+                (validar_datamuse, DATAMUSE.url),
+                (validar_priberam, PRIBERAM.url),
+                (validar_wiktionary, WIKTIONARY.url),
+            ]
+        self.fontes = fontes
+        self.lexico = carregar_lexico() if lexico is None else lexico
+        self.limite_por_host = limite_por_host
+        self._semaforos = {}
+        for _, url in fontes:
+            self._semaforos.setdefault(_host(url), threading.BoundedSemaphore(limite_por_host))
+
+    def _consultar(self, fonte, url, palavra, confirmada):
+        # Uma palavra já confirmada por outra fonte dispensa o pedido
+        if confirmada.is_set():
+            return False
+        with self._semaforos[_host(url)]:
+            if confirmada.is_set():
+                return False
+            return fonte(palavra)
+
+    def _consultar_lote(self, url, lote):
+        with self._semaforos[_host(url)]:
+            return _validar_lote_wiktionary(lote)
+
+    def validar_em_fluxo(self, palavras):
+        """Gera as palavras confirmadas à medida que as respostas chegam."""
+        pendentes = []
+        chaves_no_lexico = set()
+        for palavra in dict.fromkeys(palavras):
+            # O léxico devolve logo as formas acentuadas (ex.: 'acao' -> 'ação');
+            # candidatos com a mesma chave sem acentos ('ãçao') já as deram
+            chave = dobrar(palavra)
+            if chave in chaves_no_lexico:
+                continue
+            formas = self.lexico.formas(chave)
+            if formas:
+                chaves_no_lexico.add(chave)
+                yield from formas
+            else:
+                pendentes.append(palavra)
+        if not pendentes or not self.fontes:
+            return
+
+        # O Wiktionary responde a muitos títulos de uma vez: os lotes correm ao
+        # lado das consultas palavra a palavra às outras fontes, e só as
+        # palavras de um lote que falhou passam a ser pedidas uma a uma
+        wiktionary = next((url for fonte, url in self.fontes if fonte is validar_wiktionary), None)
+        por_palavra_fontes = [
+            (fonte, url) for fonte, url in self.fontes
+            if wiktionary is None or fonte is not validar_wiktionary
+        ]
+        confirmadas = {palavra: threading.Event() for palavra in pendentes}
+        por_palavra = {palavra: [] for palavra in pendentes}
+        futuros = {}
+        # Um conjunto de threads por host: uma consulta à espera da vez num host
+        # lento não ocupa a thread de que outro host precisa
+        executores = {
+            host: ThreadPoolExecutor(max_workers=self.limite_por_host) for host in self._semaforos
+        }
+
+        def consultar(fonte, url, palavra):
+            futuro = executores[_host(url)].submit(self._consultar, fonte, url, palavra, confirmadas[palavra])
+            futuros[futuro] = palavra
+            por_palavra[palavra].append(futuro)
+
+        def confirmar(palavra):
+            """True se a palavra ainda não tinha sido confirmada (e deve ser gerada)."""
+            if confirmadas[palavra].is_set():
+                return False
+            confirmadas[palavra].set()
+            for outro in por_palavra[palavra]:
+                outro.cancel()
+            return True
+
+        try:
+            if wiktionary is not None:
+                guardados, lotes = _lotes_wiktionary(pendentes)
+                for palavra, valida in guardados.items():
+                    if valida and confirmar(palavra):
+                        yield palavra
+                for lote in lotes:
+                    futuros[executores[_host(wiktionary)].submit(self._consultar_lote, wiktionary, lote)] = lote
+            for palavra in pendentes:
+                if not confirmadas[palavra].is_set():
+                    for fonte, url in por_palavra_fontes:
+                        consultar(fonte, url, palavra)
+
+            while futuros:
+                feitos, _ = wait(futuros, return_when=FIRST_COMPLETED)
+                for futuro in feitos:
+                    alvo = futuros.pop(futuro)
+                    if futuro.cancelled():
+                        continue
+                    try:
+                        resultado = futuro.result()
+                    except Exception:
+                        resultado = False
+                    if isinstance(alvo, list):
+                        # Lote do Wiktionary
+                        if resultado is None:
+                            for palavra in alvo:
+                                if not confirmadas[palavra].is_set():
+                                    consultar(validar_wiktionary, wiktionary, palavra)
+                            continue
+                        for palavra, valida in resultado.items():
+                            if valida and confirmar(palavra):
+                                yield palavra
+                    elif resultado and confirmar(alvo):
+                        yield alvo
+        finally:
+            for executor in executores.values():
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def validar(self, palavras):
+        """Lista das palavras confirmadas por alguma fonte."""
+        return list(self.validar_em_fluxo(palavras))
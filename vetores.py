@@ -0,0 +1,66 @@
+"""
+Vetores de inteiros de 32 bits gravados em ficheiros binários e lidos por
+mapeamento em memória, partilhados pelo léxico e pelo tesauro.
+
+Os ficheiros começam por um cabeçalho `struct` cujo primeiro campo é a
+"magia" do formato; os vetores seguem em little-endian.
+"""
+import sys
+import mmap
+import array
+
+
+def vetor(valores=()):
+    """Vetor de inteiros sem sinal de 32 bits."""
+    resultado = array.array("I", valores)
+    assert resultado.itemsize == 4, "array('I') tem de ter 4 bytes nesta plataforma"
+    return resultado
+
+
+def escrever_vetores(f, vetores):
+    """Escreve os vetores em little-endian, uns a seguir aos outros."""
+    for valores in vetores:
+        dados = vetor(valores)
+        if sys.byteorder != "little":
+            dados.byteswap()
+        f.write(dados.tobytes())
+
+
+def mapear(caminho, cabecalho, magia, descricao):
+    """
+    Mapeia o ficheiro em memória e lê o cabeçalho.
+
+    Devolve (mapa, vista, campos do cabeçalho sem a magia). Lança
+    `ValueError` se o ficheiro estiver vazio, truncado ou noutro formato.
+    """
+    with open(caminho, "rb") as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapa) < cabecalho.size or cabecalho.unpack_from(mapa, 0)[0] != magia:
+        mapa.close()
+        raise ValueError(f"Ficheiro de {descricao} inválido: {caminho}")
+    return mapa, memoryview(mapa), cabecalho.unpack_from(mapa, 0)[1:]
+
+
+def ler_vetores(vista, inicio, tamanhos, resto=0):
+    """
+    Vetores de 32 bits com os `tamanhos` dados a partir de `inicio`, sem
+    copiar os dados numa máquina little-endian.
+
+    Devolve (vetores, posição a seguir ao último). Lança `ValueError`, antes
+    de criar qualquer vista, se o ficheiro não tiver os vetores e mais
+    `resto` bytes: com vistas criadas o mapeamento já não se pode fechar.
+    """
+    if inicio + 4 * sum(tamanhos) + resto > len(vista):
+        raise ValueError("Ficheiro binário truncado")
+    partes = []
+    for tamanho in tamanhos:
+        fim = inicio + 4 * tamanho
+        if sys.byteorder == "little":
+            partes.append(vista[inicio:fim].cast("I"))
+        else:
+            valores = vetor()
+            valores.frombytes(vista[inicio:fim])
+            valores.byteswap()
+            partes.append(valores)
+        inicio = fim
+    return partes, inicio
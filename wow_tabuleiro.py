@@ -0,0 +1,183 @@
+import time
+from collections import deque
+from lexico import carregar_lexico, dobrar
+from anagramas import procurar_no_lexico
+
+# Caracteres da descrição do tabuleiro
+CASAS_VAZIAS = "_."
+
+
+class TempoEsgotado(Exception):
+    """A pesquisa excedeu o limite de tempo; `solucoes` tem as soluções já encontradas."""
+
+    def __init__(self, solucoes):
+        super().__init__("tempo esgotado")
+        self.solucoes = solucoes
+
+
+class Espaco:
+    """Espaço (palavra) do tabuleiro: sequência horizontal ou vertical de casas."""
+
+    __slots__ = ("linha", "coluna", "direcao", "casas", "molde")
+
+    def __init__(self, linha, coluna, direcao, casas, molde):
+        self.linha = linha
+        self.coluna = coluna
+        self.direcao = direcao
+        self.casas = casas
+        self.molde = molde
+
+    @property
+    def tamanho(self):
+        return len(self.casas)
+
+    def __repr__(self):
+        return f"Espaco({self.linha + 1},{self.coluna + 1},{self.direcao},{self.molde!r})"
+
+
+def ler_tabuleiro(texto):
+    """
+    Lê um tabuleiro descrito em texto, uma linha por fila:
+    '_' ou '.' é uma casa por preencher, uma letra é uma casa já conhecida e
+    qualquer outro carácter (espaço, '#') não é casa.
+
+    Devolve os espaços (sequências de 2 ou mais casas em linha ou coluna);
+    os cruzamentos resultam das casas partilhadas.
+    """
+    linhas = [linha.rstrip("\n") for linha in texto.strip("\n").splitlines()]
+    largura = max((len(linha) for linha in linhas), default=0)
+    grelha = [linha.ljust(largura) for linha in linhas]
+
+    def e_casa(r, c):
+        return 0 <= r < len(grelha) and 0 <= c < largura and (
+            grelha[r][c] in CASAS_VAZIAS or grelha[r][c].isalpha()
+        )
+
+    espacos = []
+    for direcao, (dr, dc) in (("H", (0, 1)), ("V", (1, 0))):
+        for r in range(len(grelha)):
+            for c in range(largura):
+                # Só começa um espaço onde a casa anterior não existe
+                if not e_casa(r, c) or e_casa(r - dr, c - dc):
+                    continue
+                casas = []
+                rr, cc = r, c
+                while e_casa(rr, cc):
+                    casas.append((rr, cc))
+                    rr, cc = rr + dr, cc + dc
+                if len(casas) >= 2:
+                    molde = "".join(
+                        "_" if grelha[y][x] in CASAS_VAZIAS else grelha[y][x].lower()
+                        for y, x in casas
+                    )
+                    espacos.append(Espaco(r, c, direcao, casas, molde))
+    return espacos
+
+
+def _cruzamentos(espacos):
+    """Lista de arcos (a, posição em a, b, posição em b) para cada casa partilhada."""
+    por_casa = {}
+    for i, espaco in enumerate(espacos):
+        for posicao, casa in enumerate(espaco.casas):
+            por_casa.setdefault(casa, []).append((i, posicao))
+    arcos = []
+    for ocupantes in por_casa.values():
+        for a, pa in ocupantes:
+            for b, pb in ocupantes:
+                if a != b:
+                    arcos.append((a, pa, b, pb))
+    return arcos
+
+
+def resolver_tabuleiro(letras, espacos, lexico=None, max_solucoes=1):
+    """
+    Preenche todos os espaços do tabuleiro com palavras do léxico formadas
+    com `letras`, respeitando as letras conhecidas e os cruzamentos.
+
+    Os domínios de cada espaço vêm da pesquisa na trie do léxico. Devolve
+    até `max_solucoes` soluções, cada uma uma lista com a palavra de cada
+    espaço.
+    """
+    lexico = carregar_lexico() if lexico is None else lexico
+    dominios = [
+        list(dict.fromkeys(procurar_no_lexico(letras.lower(), e.tamanho, lexico, e.molde)))
+        for e in espacos
+    ]
+    return resolver_espacos(espacos, dominios, max_solucoes)
+
+
+def resolver_espacos(espacos, dominios, max_solucoes=1, limite_tempo=None):
+    """
+    Escolhe uma palavra de `dominios[i]` para cada espaço de forma a que os
+    cruzamentos coincidam (sem acentos) e nenhuma palavra se repita.
+
+    Os domínios são reduzidos por consistência de arcos (AC-3) antes e
+    durante uma pesquisa com retrocesso que escolhe sempre o espaço com
+    menos candidatos; dentro de cada domínio mantém-se a ordem dada, por
+    isso as candidatas preferidas vêm primeiro. Com `limite_tempo`
+    (segundos) a pesquisa pára e lança `TempoEsgotado` com as soluções já
+    encontradas, para não se confundir com uma grelha sem solução.
+    """
+    dominios = [list(dominio) for dominio in dominios]
+    chaves = {palavra: dobrar(palavra) for dominio in dominios for palavra in dominio}
+    arcos = _cruzamentos(espacos)
+    vizinhos = [[] for _ in espacos]
+    for a, pa, b, pb in arcos:
+        vizinhos[a].append((pa, b, pb))
+    prazo = None if limite_tempo is None else time.monotonic() + limite_tempo
+
+    def rever(dominios, a, pa, b, pb):
+        # Remove de `a` as palavras sem apoio em `b` no cruzamento
+        apoio = {chaves[palavra][pb] for palavra in dominios[b]}
+        novo = [palavra for palavra in dominios[a] if chaves[palavra][pa] in apoio]
+        alterado = len(novo) < len(dominios[a])
+        dominios[a] = novo
+        return alterado
+
+    def ac3(dominios, fila):
+        while fila:
+            a, pa, b, pb = fila.popleft()
+            if rever(dominios, a, pa, b, pb):
+                if not dominios[a]:
+                    return False
+                fila.extend((c, pc, a, qa) for qa, c, pc in vizinhos[a] if c != b)
+        return True
+
+    if not ac3(dominios, deque(arcos)):
+        return []
+
+    solucoes = []
+    escolhidas = [None] * len(espacos)
+
+    def recuar(dominios):
+        livres = [i for i, palavra in enumerate(escolhidas) if palavra is None]
+        if not livres:
+            solucoes.append(list(escolhidas))
+            return len(solucoes) >= max_solucoes
+        if prazo is not None and time.monotonic() > prazo:
+            raise TempoEsgotado(list(solucoes))
+        i = min(livres, key=lambda j: len(dominios[j]))
+        usadas = set(escolhidas)
+        for palavra in dominios[i]:
+            if palavra in usadas:
+                continue
+            escolhidas[i] = palavra
+            copia = list(dominios)
+            copia[i] = [palavra]
+            fila = deque((c, pc, i, pi) for pi, c, pc in vizinhos[i] if escolhidas[c] is None)
+            if ac3(copia, fila) and recuar(copia):
+                return True
+            escolhidas[i] = None
+        return False
+
+    recuar(dominios)
+    return solucoes
+
+
+def preencher_tabuleiro(texto, espacos, solucao):
+    """Texto do tabuleiro com as casas preenchidas pela solução."""
+    linhas = [list(linha) for linha in texto.strip("\n").splitlines()]
+    for espaco, palavra in zip(espacos, solucao):
+        for (r, c), letra in zip(espaco.casas, palavra):
+            linhas[r][c] = letra.upper()
+    return "\n".join("".join(linha) for linha in linhas)
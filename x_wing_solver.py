@@ -1,3 +1,5 @@
+from sudoku_board import Board
+
 def find_x_wings(grid):
     """
     Identifica padrões X-Wing em um grid de Sudoku e retorna as eliminações possíveis.
@@ -9,65 +11,8 @@ def find_x_wings(grid):
     Returns:
         Uma lista de eliminações no formato [(linha, coluna, valor), ...]
     """
-    eliminations = []
-    
-    # Verifica X-Wings nas linhas
-    for num in range(1, 10):
-        # Para cada valor possível (1-9)
-        for line1 in range(9):
-            # Encontrar colunas onde o número aparece como candidato nesta linha
-            cols_with_num = [col for col in range(9) if isinstance(grid[line1][col], list) and num in grid[line1][col]]
-            
-            # Precisamos de exatamente 2 posições para um X-Wing
-            if len(cols_with_num) == 2:
-                for line2 in range(line1 + 1, 9):
-                    # Procurar outra linha onde o número aparece nas mesmas colunas
-                    cols_line2 = [col for col in range(9) if isinstance(grid[line2][col], list) and num in grid[line2][col]]
-                    
-                    # Se encontramos um padrão X-Wing
-                    if cols_line2 == cols_with_num:
-                        # Podemos eliminar este número de outras células nas mesmas colunas
-                        col1, col2 = cols_with_num
-                        
-                        # Verificar todas as outras células nas colunas col1 e col2
-                        for row in range(9):
-                            if row != line1 and row != line2:
-                                # Coluna 1
-                                if isinstance(grid[row][col1], list) and num in grid[row][col1]:
-                                    eliminations.append((row, col1, num))
-                                # Coluna 2
-                                if isinstance(grid[row][col2], list) and num in grid[row][col2]:
-                                    eliminations.append((row, col2, num))
-    
-    # Verifica X-Wings nas colunas
-    for num in range(1, 10):
-        # Para cada valor possível (1-9)
-        for col1 in range(9):
-            # Encontrar linhas onde o número aparece como candidato nesta coluna
-            rows_with_num = [row for row in range(9) if isinstance(grid[row][col1], list) and num in grid[row][col1]]
-            
-            # Precisamos de exatamente 2 posições para um X-Wing
-            if len(rows_with_num) == 2:
-                for col2 in range(col1 + 1, 9):
-                    # Procurar outra coluna onde o número aparece nas mesmas linhas
-                    rows_col2 = [row for row in range(9) if isinstance(grid[row][col2], list) and num in grid[row][col2]]
-                    
-                    # Se encontramos um padrão X-Wing
-                    if rows_col2 == rows_with_num:
-                        # Podemos eliminar este número de outras células nas mesmas linhas
-                        row1, row2 = rows_with_num
-                        
-                        # Verificar todas as outras células nas linhas row1 e row2
-                        for col in range(9):
-                            if col != col1 and col != col2:
-                                # Linha 1
-                                if isinstance(grid[row1][col], list) and num in grid[row1][col]:
-                                    eliminations.append((row1, col, num))
-                                # Linha 2
-                                if isinstance(grid[row2][col], list) and num in grid[row2][col]:
-                                    eliminations.append((row2, col, num))
-    
-    return eliminations
+    # As contas são feitas com máscaras de bits (ver sudoku_board.Board)
+    return Board.from_grid(grid).find_x_wings()
 
 def apply_x_wing(grid):
     """
@@ -81,12 +26,10 @@ def apply_x_wing(grid):
         Um booleano indicando se alguma eliminação foi feita
         O grid modificado
     """
-    eliminations = find_x_wings(grid)
-    
-    if eliminations:
-        # Aplicar as eliminações
-        for row, col, val in eliminations:
-            grid[row][col].remove(val)
+    board = Board.from_grid(grid)
+    if board.apply_x_wing():
+        # Escreve os candidatos que restam na própria matriz recebida
+        board.update_grid(grid)
         return True, grid
     
     return False, grid
@@ -137,34 +80,7 @@ def fill_candidates(grid):
     Returns:
         Uma matriz 9x9 com candidatos preenchidos
     """
-    # Para cada célula não resolvida
-    for row in range(9):
-        for col in range(9):
-            if isinstance(grid[row][col], list):
-                # Obter valores já usados na linha, coluna e bloco 3x3
-                used_values = set()
-                
-                # Verificar linha
-                for c in range(9):
-                    if isinstance(grid[row][c], int):
-                        used_values.add(grid[row][c])
-                
-                # Verificar coluna
-                for r in range(9):
-                    if isinstance(grid[r][col], int):
-                        used_values.add(grid[r][col])
-                
-                # Verificar bloco 3x3
-                block_row, block_col = 3 * (row // 3), 3 * (col // 3)
-                for r in range(block_row, block_row + 3):
-                    for c in range(block_col, block_col + 3):
-                        if isinstance(grid[r][c], int):
-                            used_values.add(grid[r][c])
-                
-                # Atualizar candidatos
-                grid[row][col] = [n for n in range(1, 10) if n not in used_values]
-    
-    return grid
+    return Board.from_grid(grid).fill_candidates().update_grid(grid)
 
 def print_grid(grid):
     """